@@ -5,13 +5,31 @@ from datetime import datetime, timezone
 import dateutil.parser
 from pathlib import Path
 import logging
+import warnings
+import functools
+from .readers import iter_log_chunks, detect_format, CHUNK_ROWS
+from .events import EventTable, category_names_for, OTHER, UNCATEGORIZED
 
 logger = logging.getLogger(__name__)
 
+# How many fallback-parsed rows between progress callbacks
+PROGRESS_EVERY = 1000
+
 def load_fault_categories(config_path: Path):
+    """Parsed taxonomy as ``(name, keywords)`` pairs, or ``None`` without a usable config.
+
+    Parsed once per version of the file (path, mtime and size), so long-lived
+    processes share one copy and still see edits.
+    """
     if not config_path.is_file():
         logger.warning(f"Config file not found: {config_path}")
         return None
+    st = config_path.stat()
+    return _parse_fault_categories(str(config_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_fault_categories(config_path, mtime_ns, size):
     categories = []
     try:
         with open(config_path, encoding="utf-8") as f:
@@ -23,9 +41,10 @@ def load_fault_categories(config_path: Path):
                 cat_name = parts[0].strip()
                 keywords = [k.strip().lower() for k in parts[1].rstrip(']').split(',') if k.strip()]
                 if keywords:
-                    categories.append((cat_name, set(keywords)))
+                    categories.append((cat_name, frozenset(keywords)))
         logger.info(f"Loaded {len(categories)} fault categories from {config_path}")
-        return categories
+        # Cached and shared between callers, so handed out read-only
+        return tuple(categories)
     except Exception as e:
         logger.error(f"Error loading fault categories: {e}")
         return None
@@ -43,73 +62,180 @@ def categorize_description(desc: str, categories, multi_label: bool = False):
 
 
 def load_failure_data(csv_path: Path, config_path: Path, start_time_str: str = None,
-                      multi_label: bool = False):
+                      multi_label: bool = False, progress=None, since=None, until=None,
+                      fmt='auto', time_field=None, desc_field=None):
+    """Load, sort and categorize failure events from a CSV or JSON-lines log.
+
+    Returns ``(t_hours, events, t0, fault_categories)`` where ``events`` is an
+    :class:`~modeler.events.EventTable` that still iterates as the legacy
+    ``(isoformat, hours, categories, description)`` tuples.
+
+    ``progress`` is an optional callback ``progress(stage, **info)`` used to
+    report rows parsed and the categorization rate while loading. ``since`` and
+    ``until`` restrict the events to a time window (see ``time_range_mask``).
+    ``fmt``, ``time_field`` and ``desc_field`` select the reader and fields
+    (see ``modeler.readers``); compressed logs are decoded as a stream.
+    """
     fault_categories = load_fault_categories(config_path)
 
-    if not csv_path.exists():
-        logger.error(f"CSV file not found: {csv_path}")
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    epoch_ns, descs, _ = read_log_events(csv_path, progress, fmt, time_field, desc_field)
+    if since is not None or until is not None:
+        in_range = time_range_mask(epoch_ns, since, until)
+        epoch_ns, descs = epoch_ns[in_range], descs[in_range]
+
+    return build_failure_events(epoch_ns, descs, fault_categories, start_time_str,
+                                multi_label, progress)
+
+
+def read_log_events(log_path: Path, progress=None, fmt='auto', time_field=None, desc_field=None,
+                    chunksize=CHUNK_ROWS):
+    """Parse a failure log into ``(epoch_ns, descriptions, row_numbers)`` of its valid rows.
 
+    The log (CSV or JSON-lines, optionally gzip/bz2/xz-compressed) is
+    streamed ``chunksize`` rows at a time; identical descriptions share one
+    string object across chunks.
+    """
+    if not log_path.exists():
+        logger.error(f"Log file not found: {log_path}")
+        raise FileNotFoundError(f"CSV file not found: {log_path}")
+
+    times, texts, rows = [], [], []
+    interned = {}
+    total = 0
+    fmt = detect_format(log_path) if fmt == 'auto' else fmt
     try:
-        df = pd.read_csv(csv_path)
-        logger.info(f"Loaded {len(df)} rows from {csv_path}")
+        for chunk in iter_log_chunks(log_path, fmt, time_field, desc_field, chunksize):
+            # JSON-lines frames hold just the (timestamp, description) fields the reader picked
+            columns = tuple(chunk.columns[:2]) if fmt == 'jsonl' else (time_field, desc_field)
+            epoch_ns, descs, chunk_rows = parse_event_frame(chunk, None, *columns)
+            times.append(epoch_ns)
+            texts.append(np.array([interned.setdefault(d, d) for d in descs], dtype=object))
+            rows.append(chunk_rows + total)
+            total += len(chunk)
+            if progress: progress("parse", rows_parsed=total, errors=total - sum(len(r) for r in rows))
     except Exception as e:
-        logger.error(f"Failed to read CSV: {e}")
+        logger.error(f"Failed to read log: {e}")
         raise
-
-    dt_col = next((c for c in df.columns if any(k in str(c).lower() for k in ['date','time','datetime','logged','timestamp'])), df.columns[0])
-    desc_col = next((c for c in df.columns if c != dt_col and any(k in str(c).lower() for k in ['desc','error','fault','message'])), None)
+    logger.info(f"Loaded {total} rows from {log_path}")
+    if progress: progress("read", rows=total)
+
+    if not times:
+        return np.array([], dtype=np.int64), np.array([], dtype=object), np.array([], dtype=np.int64)
+    return np.concatenate(times), np.concatenate(texts), np.concatenate(rows)
+
+
+def parse_event_frame(df: pd.DataFrame, progress=None, dt_col=None, desc_col=None):
+    """Parse the valid rows of ``df``, detecting the timestamp/description columns unless given.
+
+    Raises ``ValueError`` if a column named explicitly is not in ``df``.
+    """
+    for column in (dt_col, desc_col):
+        if column is not None and column not in df.columns:
+            raise ValueError(f"Column '{column}' not found; available: {', '.join(map(str, df.columns))}")
+    if dt_col is None:
+        dt_col = next((c for c in df.columns if any(k in str(c).lower() for k in ['date','time','datetime','logged','timestamp'])), df.columns[0])
+    if desc_col is None:
+        desc_col = next((c for c in df.columns if c != dt_col and any(k in str(c).lower() for k in ['desc','error','fault','message'])), None)
     
     logger.debug(f"Identified columns - Timestamp: {dt_col}, Description: {desc_col}")
 
-    # Robust loading: Extract (dt, desc) pairs, then sort
-    full_events = []
-    
-    # Use iterrows for safety
-    errors = 0
-    for index, row in df.iterrows():
+    epoch_ns, valid = parse_timestamps(df[dt_col], progress=progress)
+    descs = df[desc_col].astype(object).map(str).to_numpy() if desc_col else np.full(len(df), "", dtype=object)
+
+    errors = int((~valid).sum())
+    if progress: progress("parse", rows_parsed=len(valid), total_rows=len(valid), errors=errors)
+
+    if errors > 0:
+        logger.warning(f"Skipped {errors} rows due to parsing errors.")
+
+    return epoch_ns[valid], descs[valid], np.flatnonzero(valid)
+
+
+def to_epoch_ns(value):
+    """Epoch nanoseconds of a datetime or timestamp string (naive taken as UTC)."""
+    if value is None:
+        return None
+    dt = value if isinstance(value, datetime) else dateutil.parser.parse(str(value))
+    if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
+    return pd.Timestamp(dt).as_unit('ns').value
+
+
+def time_range_mask(epoch_ns, since=None, until=None):
+    """Events with ``since <= t < until``; either bound may be omitted."""
+    mask = np.ones(len(epoch_ns), dtype=bool)
+    if since is not None: mask &= epoch_ns >= to_epoch_ns(since)
+    if until is not None: mask &= epoch_ns < to_epoch_ns(until)
+    return mask
+
+
+def parse_timestamps(values, progress=None):
+    """Parse timestamps to UTC epoch nanoseconds.
+
+    Naive timestamps are taken as UTC. Values the vectorized pandas parsers
+    reject fall back to a fuzzy ``dateutil`` parse, one row at a time.
+    Returns ``(epoch_ns, valid)``; invalid rows hold 0.
+    """
+    values = pd.Series(values, dtype=object).map(str).reset_index(drop=True)
+    epoch_ns = np.zeros(len(values), dtype=np.int64)
+    valid = np.zeros(len(values), dtype=bool)
+
+    pending = np.arange(len(values))
+    for fmt in (None, 'mixed'):
+        if not len(pending):
+            break
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            parsed = pd.to_datetime(values.iloc[pending], errors='coerce', utc=True, format=fmt)
+        ok = parsed.notna().to_numpy()
+        epoch_ns[pending[ok]] = parsed[ok].dt.as_unit('ns').astype('int64').to_numpy()
+        valid[pending[ok]] = True
+        pending = pending[~ok]
+
+    for done, index in enumerate(pending, 1):
         try:
-            val = str(row[dt_col])
-            dt = dateutil.parser.parse(val, fuzzy=True)
+            dt = dateutil.parser.parse(values.iloc[index], fuzzy=True)
             if dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
-            
-            desc = str(row[desc_col]) if desc_col else ""
-            full_events.append((dt, desc))
+            epoch_ns[index] = pd.Timestamp(dt).as_unit('ns').value
+            valid[index] = True
         except Exception:
-            errors += 1
-            continue
+            pass
+        if progress and done % PROGRESS_EVERY == 0:
+            progress("parse", rows_parsed=len(values) - len(pending) + done, total_rows=len(values))
 
-    if errors > 0:
-        logger.warning(f"Skipped {errors} rows due to parsing errors.")
+    return epoch_ns, valid
 
-    if not full_events:
-        logger.warning("No valid data found in CSV!")
-        return np.array([]), [], datetime.now(timezone.utc), fault_categories
 
-    full_events.sort(key=lambda x: x[0])
-    sorted_times = [x[0] for x in full_events]
-    sorted_descs = [x[1] for x in full_events]
+def build_failure_events(epoch_ns, descs, fault_categories, start_time_str=None,
+                         multi_label=False, progress=None):
+    """Sort, relativize and categorize parsed events into the loader's return tuple."""
+    if not len(epoch_ns):
+        logger.warning("No valid failure data found!")
+        return np.array([]), EventTable.empty(category_names_for(fault_categories), multi_label), \
+            datetime.now(timezone.utc), fault_categories
 
-    t0 = dateutil.parser.parse(start_time_str) if start_time_str else sorted_times[0]
-    if t0.tzinfo is None: t0 = t0.replace(tzinfo=timezone.utc)
+    order = np.argsort(epoch_ns, kind='stable')
+    epoch_ns = epoch_ns[order]
+    descs = descs[order]
 
-    failure_events = []
-    
-    for dt, desc in zip(sorted_times, sorted_descs):
-        cats = categorize_description(desc, fault_categories, multi_label)
-        rel_hours = (dt - t0).total_seconds() / 3600.0
-        if rel_hours >= 0:
-            failure_events.append((dt, rel_hours, cats, desc))
-
-    failure_events.sort(key=lambda x: x[1])
-    t_hours = np.array([ev[1] for ev in failure_events])
-
-    cat_list = []
-    for ev in failure_events:
-        dt_iso = ev[0].isoformat()
-        time_h = round(ev[1], 4)
-        cats_str = ", ".join(ev[2]) if isinstance(ev[2], list) else ev[2]
-        cat_list.append((dt_iso, time_h, cats_str, ev[3]))
-    
-    logger.info(f"Processed {len(failure_events)} valid failure events.")
-    return t_hours, cat_list, t0, fault_categories
+    if start_time_str:
+        t0 = dateutil.parser.parse(start_time_str)
+        if t0.tzinfo is None: t0 = t0.replace(tzinfo=timezone.utc)
+        t0_ns = pd.Timestamp(t0).as_unit('ns').value
+    else:
+        t0_ns = int(epoch_ns[0])
+        t0 = pd.Timestamp(t0_ns, tz='UTC').to_pydatetime()
+
+    keep = epoch_ns >= t0_ns
+    epoch_ns = epoch_ns[keep]
+    t_hours = (epoch_ns - t0_ns) / 3.6e12
+
+    events = EventTable.build(epoch_ns, t_hours, descs[keep], fault_categories, multi_label)
+
+    if progress:
+        uncategorized = events.category_mask(OTHER) | events.category_mask(UNCATEGORIZED)
+        categorized = int(len(events) - uncategorized.sum())
+        progress("categorize", events=len(events), categorized=categorized,
+                 rate=categorized / len(events) if len(events) else 0.0)
+
+    logger.info(f"Processed {len(events)} valid failure events.")
+    return events.hours, events, t0, fault_categories
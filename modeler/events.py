@@ -0,0 +1,205 @@
+
+import numpy as np
+import pandas as pd
+from collections import Counter
+from collections.abc import Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ['Original_Timestamp', 'Time_Hours', 'Categories', 'Description']
+OTHER = "Other / Uncategorized"
+UNCATEGORIZED = "Uncategorized"
+
+
+def category_names_for(fault_categories):
+    """Category code table: configured categories in config order, then the fallbacks."""
+    names = [name for name, _ in (fault_categories or [])]
+    for fallback in (OTHER, UNCATEGORIZED):
+        if fallback not in names:
+            names.append(fallback)
+    return names
+
+
+class EventTable(Sequence):
+    """Column-oriented table of categorized failure events.
+
+    Holds one float64 hours array, one int64 epoch-ns array, one category code
+    array and one int32 index into the interned descriptions. Single-label
+    codes are uint8/uint16 indices into ``category_names``; multi-label codes
+    are bitmasks packed into a (n, ceil(k/8)) uint8 array.
+
+    Indexing and iteration yield the legacy
+    ``(isoformat, rounded hours, joined categories, description)`` tuples,
+    built lazily so existing callers keep working.
+    """
+
+    def __init__(self, hours, epoch_ns, codes, category_names, desc_index, descriptions,
+                 multi_label=False):
+        self.hours = np.asarray(hours, dtype=np.float64)
+        self.epoch_ns = np.asarray(epoch_ns, dtype=np.int64)
+        self.codes = codes
+        self.category_names = list(category_names)
+        self.desc_index = np.asarray(desc_index, dtype=np.int32)
+        self.descriptions = descriptions
+        self.multi_label = multi_label
+        self._labels = None
+
+    @classmethod
+    def empty(cls, category_names=(), multi_label=False):
+        names = list(category_names) or category_names_for(None)
+        codes = np.zeros((0, _mask_width(len(names))) if multi_label else 0, dtype=np.uint8)
+        return cls(np.array([]), np.array([], dtype=np.int64), codes, names,
+                   np.array([], dtype=np.int32), np.array([], dtype=object), multi_label)
+
+    @classmethod
+    def build(cls, epoch_ns, hours, descriptions, fault_categories, multi_label=False):
+        """Categorize and intern ``descriptions``; every unique text is matched once."""
+        from .data import categorize_description
+
+        names = category_names_for(fault_categories)
+        lookup = {name: i for i, name in enumerate(names)}
+        desc_index, uniques = pd.factorize(pd.Series(descriptions, dtype=object), use_na_sentinel=False)
+        uniques = np.asarray(uniques, dtype=object)
+
+        if multi_label:
+            unique_bits = np.zeros((len(uniques), len(names)), dtype=bool)
+            for i, desc in enumerate(uniques):
+                for cat in categorize_description(desc, fault_categories, True):
+                    unique_bits[i, lookup[cat]] = True
+            codes = np.packbits(unique_bits, axis=1)[desc_index]
+        else:
+            unique_codes = np.array([lookup[categorize_description(desc, fault_categories, False)]
+                                     for desc in uniques], dtype=_code_dtype(len(names)))
+            codes = unique_codes[desc_index]
+
+        return cls(hours, epoch_ns, codes, names, desc_index, uniques, multi_label)
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a table from legacy ``(isoformat, hours, categories, description)`` tuples."""
+        records = list(records)
+        if not records:
+            return cls.empty()
+        iso, hours, cats, descs = zip(*records)
+        epoch_ns = pd.to_datetime(pd.Series(iso), utc=True, format='mixed').dt.as_unit('ns').astype('int64').to_numpy()
+        split = [c.split(", ") for c in cats]
+        multi_label = any(len(c) > 1 for c in split)
+        names = list(dict.fromkeys(c for labels in split for c in labels))
+        lookup = {name: i for i, name in enumerate(names)}
+        desc_index, uniques = pd.factorize(pd.Series(descs, dtype=object), use_na_sentinel=False)
+        if multi_label:
+            bits = np.zeros((len(records), len(names)), dtype=bool)
+            for i, labels in enumerate(split):
+                bits[i, [lookup[c] for c in labels]] = True
+            codes = np.packbits(bits, axis=1)
+        else:
+            codes = np.array([lookup[labels[0]] for labels in split], dtype=_code_dtype(len(names)))
+        return cls(hours, epoch_ns, codes, names, desc_index, np.asarray(uniques, dtype=object), multi_label)
+
+    def __len__(self):
+        return len(self.hours)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._records(range(len(self))[index]))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        return next(self._records([index]))
+
+    def __iter__(self):
+        return self._records(range(len(self)))
+
+    def _records(self, indices):
+        indices = np.asarray(indices, dtype=np.int64)
+        labels = self.category_labels()
+        stamps = pd.to_datetime(self.epoch_ns[indices], utc=True).to_pydatetime()
+        for i, stamp in zip(indices, stamps):
+            yield (stamp.isoformat(), round(float(self.hours[i]), 4), labels[i],
+                   self.descriptions[self.desc_index[i]])
+
+    def to_records(self):
+        return list(self)
+
+    def to_frame(self):
+        """Legacy four-column DataFrame, built column by column."""
+        stamps = pd.to_datetime(self.epoch_ns, utc=True).to_pydatetime()
+        return pd.DataFrame({
+            COLUMNS[0]: [s.isoformat() for s in stamps],
+            COLUMNS[1]: np.round(self.hours, 4),
+            COLUMNS[2]: self.category_labels(),
+            COLUMNS[3]: self.descriptions[self.desc_index] if len(self) else np.array([], dtype=object),
+        }, columns=COLUMNS)
+
+    def category_labels(self):
+        """Joined category string per event (object array), cached."""
+        if self._labels is None:
+            if self.multi_label:
+                patterns, inverse = np.unique(self.codes, axis=0, return_inverse=True)
+                joined = np.array([", ".join(self._names_in(p)) for p in patterns], dtype=object)
+                self._labels = joined[inverse.reshape(-1)] if len(self) else np.array([], dtype=object)
+            else:
+                self._labels = np.array(self.category_names, dtype=object)[self.codes] \
+                    if len(self) else np.array([], dtype=object)
+        return self._labels
+
+    def _names_in(self, packed):
+        bits = np.unpackbits(packed)[:len(self.category_names)]
+        return [self.category_names[i] for i in np.flatnonzero(bits)]
+
+    def category_mask(self, name):
+        """Boolean mask of events tagged with ``name``."""
+        if name not in self.category_names:
+            return np.zeros(len(self), dtype=bool)
+        code = self.category_names.index(name)
+        if self.multi_label:
+            return (self.codes[:, code // 8] & (0x80 >> (code % 8))) != 0
+        return self.codes == code
+
+    def category_counts(self):
+        """Counter of events per category, in order of first appearance."""
+        counts = Counter()
+        if not len(self):
+            return counts
+        if self.multi_label:
+            bits = np.unpackbits(self.codes, axis=1)[:, :len(self.category_names)].astype(bool)
+            totals = bits.sum(axis=0)
+            first = np.where(bits.any(axis=0), bits.argmax(axis=0), len(self))
+        else:
+            totals = np.bincount(self.codes, minlength=len(self.category_names))
+            present, first_seen = np.unique(self.codes, return_index=True)
+            first = np.full(len(self.category_names), len(self))
+            first[present] = first_seen
+        for code in np.argsort(first, kind='stable'):
+            if totals[code]:
+                counts[self.category_names[code]] = int(totals[code])
+        return counts
+
+    def select(self, mask):
+        """Sub-table of the events where ``mask`` is true."""
+        return EventTable(self.hours[mask], self.epoch_ns[mask], self.codes[mask], self.category_names,
+                          self.desc_index[mask], self.descriptions, self.multi_label)
+
+    @property
+    def nbytes(self):
+        """Approximate resident size of the table, including interned descriptions."""
+        text = sum(len(d) for d in self.descriptions) + 49 * len(self.descriptions)
+        return (self.hours.nbytes + self.epoch_ns.nbytes + self.codes.nbytes
+                + self.desc_index.nbytes + self.descriptions.nbytes + text)
+
+
+def as_event_table(events):
+    """Accept an ``EventTable`` or a legacy list of event tuples."""
+    if isinstance(events, EventTable):
+        return events
+    return EventTable.from_records(events)
+
+
+def _code_dtype(n_categories):
+    return np.uint8 if n_categories <= 256 else np.uint16
+
+
+def _mask_width(n_categories):
+    return max(1, (n_categories + 7) // 8)
@@ -2,77 +2,219 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import json
 import logging
-from .plots import plot_reliability_growth, plot_categories, plot_failure_intensity
-from .models import go_intensity, mo_intensity
+import time
+from .models import INTENSITY_FUNCTIONS, MODEL_NAMES, aic_after_origin
+from .events import as_event_table
+from .forecast import forecast_summary_lines
+from .intensity import kernel_intensity
+from .trend import trend_summary_lines, trend_rows
 
 logger = logging.getLogger(__name__)
 
+# Output name -> file suffix. Plot outputs import matplotlib only when selected.
+OUTPUT_FILES = {
+    'parameters': '_parameters.csv',
+    'predictions': '_predictions.csv',
+    'categorized': '_categorized.csv',
+    'category_trends': '_category_trends.csv',
+    'trend_tests': '_trend_tests.csv',
+    'summary': '_human_summary.txt',
+    'reliability_plot': '_reliability_plot.png',
+    'intensity_plot': '_intensity_plot.png',
+    'category_plot': '_category_plot.png',
+}
+PARAMETER_COLUMNS = ['Model', 'Param1', 'Param2', 'Param1_SE', 'Param2_SE', 'LogLikelihood', 'AIC',
+                     'AIC_After_Origin']
+TREND_COLUMNS = ['Test', 'Statistic', 'DF', 'P_Value_Growth', 'N']
+PLOT_OUTPUTS = ('reliability_plot', 'intensity_plot', 'category_plot')
+OUTPUTS = tuple(OUTPUT_FILES)
+
+
+def select_outputs(names=None, plots=True):
+    """Resolve a list of output names (``None`` means all) into an ordered tuple."""
+    if names is None:
+        selected = OUTPUTS
+    else:
+        unknown = set(names) - set(OUTPUTS)
+        if unknown:
+            raise ValueError(f"Unknown output(s): {', '.join(sorted(unknown))}. "
+                             f"Choose from: {', '.join(OUTPUTS)}")
+        selected = tuple(o for o in OUTPUTS if o in names)
+    if not plots:
+        selected = tuple(o for o in selected if o not in PLOT_OUTPUTS)
+    return selected
+
+
 def export_and_summarize(results, tt, curves, observed_times, observed_cum, ensemble,
-                         categorized_list, prefix, fault_categories, t, T):
+                         categorized_list, prefix, fault_categories, t, T,
+                         outputs=None, plots=True, max_workers=None, forecast=None, crow=None,
+                         trend=None, trend_gate='off'):
+    """Write the selected outputs concurrently and return the run manifest.
+
+    Each output is an independent task on a thread pool; unselected outputs
+    are never computed. The manifest (``<prefix>_manifest.json``) records
+    every file written and how long it took. ``forecast`` (from
+    ``modeler.forecast.simulate_future_failures``) and ``crow`` (from
+    ``modeler.models.crow_screening``) are added to the summary; ``trend``
+    (from ``modeler.trend.trend_tests``) goes to the summary and its own CSV.
+    """
     if not prefix:
         prefix = datetime.now().strftime("%Y%m%d_%H%M%S")
+    selected = select_outputs(outputs, plots)
+    started = time.perf_counter()
+
+    total_expected_dict = {m: r[3] for m, r in results.items()}
+    events = as_event_table(categorized_list)
+
+    # Intensity curves are shared by the predictions export and the intensity plot
+    curves_intensity = {}
+    ensemble_intensity = None
+    for m in curves:
+        params = results[m][0]
+        curves_intensity[m] = INTENSITY_FUNCTIONS[m](tt, params)
+    if ensemble is not None and len(curves_intensity) >= 2:
+        # Ensemble intensity = average of intensities
+        ensemble_intensity = np.mean(list(curves_intensity.values()), axis=0)
 
-    # Parameters
+    # Nonparametric intensity of the observed failures, to check the fitted curves against
+    empirical = None
+    if {'predictions', 'intensity_plot'} & set(selected):
+        empirical, bandwidth = kernel_intensity(t, tt, T)
+        if bandwidth:
+            logger.info(f"Empirical intensity bandwidth: {bandwidth:.3g} hours")
+
+    summary_lines = _summary_lines(results, tt, ensemble, events, t, T, total_expected_dict, forecast, crow,
+                                   trend, trend_gate) if 'summary' in selected else []
+
+    tasks = {
+        'parameters': lambda path: _write_parameters(results, path, t, T),
+        'predictions': lambda path: _write_predictions(results, tt, curves, curves_intensity, ensemble,
+                                                       ensemble_intensity, observed_times, observed_cum, path,
+                                                       empirical),
+        'categorized': lambda path: events.to_frame().to_csv(path, index=False),
+        'category_trends': lambda path: _write_category_trends(events, path),
+        'trend_tests': lambda path: pd.DataFrame(trend_rows(trend), columns=TREND_COLUMNS).to_csv(path, index=False),
+        'summary': lambda path: _write_summary(summary_lines, path),
+        'reliability_plot': lambda path: _plot('plot_reliability_growth', t, len(t), curves, results,
+                                               ensemble, tt, prefix),
+        'intensity_plot': lambda path: _plot('plot_failure_intensity', tt, curves_intensity,
+                                             ensemble_intensity, prefix, empirical),
+        'category_plot': lambda path: _plot('plot_categories', events, prefix),
+    }
+
+    def run(name):
+        path = f"{prefix}{OUTPUT_FILES[name]}"
+        with _plot_lock() if name in PLOT_OUTPUTS else nullcontext():
+            task_start = time.perf_counter()
+            try:
+                written = tasks[name](path)
+                status = "failed" if name in PLOT_OUTPUTS and written is None else "written"
+            except Exception as e:
+                logger.error(f"Failed to write {name} output: {e}")
+                status = "failed"
+            seconds = round(time.perf_counter() - task_start, 4)
+        return {"name": name, "path": path, "status": status, "seconds": seconds}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        entries = list(pool.map(run, selected))
+
+    manifest = {
+        "prefix": prefix,
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "outputs": entries,
+        "skipped": [o for o in OUTPUTS if o not in selected],
+        "total_seconds": round(time.perf_counter() - started, 4),
+    }
+    manifest_path = f"{prefix}_manifest.json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Saved run manifest to {manifest_path}")
+
+    if summary_lines:
+        print("\n".join(summary_lines))
+    print(f"\nSaved files with prefix: {prefix}")
+    for entry in entries:
+        if entry["status"] == "written":
+            print(f"  * {entry['path']}  ({entry['seconds']:.2f}s)")
+    print(f"  * {manifest_path}  <- run manifest")
+    return manifest
+
+
+def _write_parameters(results, path, t, T):
+    # AIC is each fit's own; Crow-AMSAA leaves out the failure at the origin, so models
+    # are ranked by AIC_After_Origin, which scores every fit on the same failures
     param_rows = []
-    total_expected_dict = {}
     for m, (params, ll, se, total_exp) in results.items():
-        name = "Goel-Okumoto" if m == 'go' else "Musa-Okumoto"
+        name = MODEL_NAMES.get(m, m)
         param_rows.append({
             'Model': name, 'Param1': params[0], 'Param2': params[1] if len(params)>1 else np.nan,
             'Param1_SE': se[0] if len(se)>0 else np.nan, 'Param2_SE': se[1] if len(se)>1 else np.nan,
-            'LogLikelihood': ll, 'AIC': 4 - 2*ll if ll is not None else np.nan
+            'LogLikelihood': ll, 'AIC': 4 - 2*ll if ll is not None else np.nan,
+            'AIC_After_Origin': aic_after_origin(t, T, m, params)
         })
-        total_expected_dict[m] = total_exp
-    pd.DataFrame(param_rows).to_csv(f"{prefix}_parameters.csv", index=False)
+    pd.DataFrame(param_rows, columns=PARAMETER_COLUMNS).to_csv(path, index=False)
 
-    # Predictions & Intensity
-    pred_rows = []
-    curves_intensity = {}
-    ensemble_intensity = None
 
+def _write_predictions(results, tt, curves, curves_intensity, ensemble, ensemble_intensity,
+                       observed_times, observed_cum, path, empirical=None):
+    pred_rows = []
     for m, curve in curves.items():
-        # Calculate intensity curve
-        params = results[m][0]
-        if m == 'go':
-            intensity = go_intensity(tt, params)
-        else:
-            intensity = mo_intensity(tt, params)
-        curves_intensity[m] = intensity
-
+        intensity = curves_intensity[m]
         for ti, mui, lami in zip(tt, curve, intensity):
-            pred_rows.append({'Model': results[m][3] if m in results else m,
+            pred_rows.append({'Model': MODEL_NAMES.get(m, m),
                               'Time_hours': round(ti,4), 'Predicted_Mean': round(mui,4),
                               'Predicted_Intensity': round(lami, 6),
                               'CI_Lower_95pct': round(mui - 1.96 * np.sqrt(max(0.1, mui)), 4),
                               'CI_Upper_95pct': round(mui + 1.96 * np.sqrt(max(0.1, mui)), 4)})
-    if ensemble is not None:
-        # Ensemble intensity = average of intensities
-        intensities = list(curves_intensity.values())
-        if len(intensities) == 2:
-            ensemble_intensity = (intensities[0] + intensities[1]) / 2
-            
-            for ti, mui, lami in zip(tt, ensemble, ensemble_intensity):
-                pred_rows.append({'Model':'Ensemble', 'Time_hours':round(ti,4), 'Predicted_Mean':round(mui,4),
+    if ensemble is not None and ensemble_intensity is not None:
+        for ti, mui, lami in zip(tt, ensemble, ensemble_intensity):
+            pred_rows.append({'Model':'Ensemble', 'Time_hours':round(ti,4), 'Predicted_Mean':round(mui,4),
+                              'Predicted_Intensity': round(lami, 6),
+                              'CI_Lower_95pct':np.nan, 'CI_Upper_95pct':np.nan})
+    if empirical is not None:
+        for ti, lami in zip(tt, empirical):
+            if np.isfinite(lami):
+                pred_rows.append({'Model': 'Empirical', 'Time_hours': round(ti, 4), 'Predicted_Mean': np.nan,
                                   'Predicted_Intensity': round(lami, 6),
-                                  'CI_Lower_95pct':np.nan, 'CI_Upper_95pct':np.nan})
+                                  'CI_Lower_95pct': np.nan, 'CI_Upper_95pct': np.nan})
     for ti, ci in zip(observed_times, observed_cum):
         pred_rows.append({'Model':'Observed', 'Time_hours':round(ti,4), 'Predicted_Mean':ci,
                           'Predicted_Intensity': np.nan,
                           'CI_Lower_95pct':np.nan, 'CI_Upper_95pct':np.nan})
-    pd.DataFrame(pred_rows).to_csv(f"{prefix}_predictions.csv", index=False)
+    pd.DataFrame(pred_rows).to_csv(path, index=False)
 
-    # Categorized
-    cat_df = pd.DataFrame(categorized_list, columns=['Original_Timestamp', 'Time_Hours', 'Categories', 'Description'])
-    cat_df.to_csv(f"{prefix}_categorized.csv", index=False)
 
-    # Category trends
-    cat_df['Time_Hours_Rounded'] = cat_df['Time_Hours'].round(0)
+def _write_category_trends(events, path):
+    cat_df = pd.DataFrame({'Categories': events.category_labels(),
+                           'Time_Hours_Rounded': np.round(events.hours, 4).round(0)})
     grouped = cat_df.groupby(['Categories', 'Time_Hours_Rounded']).size().unstack(fill_value=0).cumsum(axis=1)
     trend_df = grouped.reset_index().melt(id_vars=['Categories'], var_name='Time_Hours', value_name='Cumulative_Failures')
-    trend_df.to_csv(f"{prefix}_category_trends.csv", index=False)
+    trend_df.to_csv(path, index=False)
+
+
+def _write_summary(summary_lines, path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(summary_lines))
+    logger.info(f"Saved summary to {path}")
+
+
+def _plot(func_name, *args):
+    from . import plots
+    return getattr(plots, func_name)(*args)
+
+
+def _plot_lock():
+    # Shared with every other pyplot user in the process (the API renders too)
+    from .plots import PLOT_LOCK
+    return PLOT_LOCK
 
+
+def _summary_lines(results, tt, ensemble, events, t, T, total_expected_dict, forecast=None, crow=None,
+                   trend=None, trend_gate='off'):
     # Human-friendly summary
     current_failures = len(t)
     current_time = T
@@ -80,6 +222,7 @@ def export_and_summarize(results, tt, curves, observed_times, observed_cum, ense
     summary_lines = []
     summary_lines.append("=== Easy-to-Understand Reliability Summary ===\n")
     summary_lines.append(f"We have seen {current_failures} failures so far after {current_time:.1f} hours of testing/runtime.\n")
+    summary_lines.extend(trend_summary_lines(trend, trend_gate))
 
     if ensemble is not None:
         ens_at_500  = np.interp(500,  tt, ensemble)
@@ -89,19 +232,21 @@ def export_and_summarize(results, tt, curves, observed_times, observed_cum, ense
         more_2000 = max(0, round(ens_at_2000 - current_failures))
         more_5000 = max(0, round(ens_at_5000 - current_failures))
 
-        summary_lines.append("Best guess (average of two models):")
+        count = {2: "two", 3: "three"}.get(len(results), str(len(results)))
+        summary_lines.append(f"Best guess (average of {count} models):")
         summary_lines.append(f"  * In the next ~{500 - current_time:.0f} hours -> about {more_500} more failures expected")
         summary_lines.append(f"  * In the next ~{2000 - current_time:.0f} hours -> about {more_2000} more failures expected")
         summary_lines.append(f"  * Long-term (after ~{5000 - current_time:.0f} more hours) -> total around {round(ens_at_5000)} failures expected\n")
 
-    if results:
-        best_model = min(results, key=lambda k: 4 - 2*results[k][1])  # lowest AIC
+    summary_lines.extend(forecast_summary_lines(forecast))
+    summary_lines.extend(_crow_summary_lines(results, crow))
+
+    # Per-category estimates need a model with a finite total (not the power law)
+    finite = [m for m in results if total_expected_dict[m] is not None]
+    if finite:
+        best_model = min(finite, key=lambda k: 4 - 2*results[k][1])  # lowest AIC
         best_total = total_expected_dict[best_model]
-        cat_counts = Counter()
-        for row in categorized_list:
-            cats = row[2].split(", ")
-            for c in cats:
-                cat_counts[c] += 1
+        cat_counts = events.category_counts()
         total_seen = sum(cat_counts.values())
 
         if total_seen > 0:
@@ -112,21 +257,34 @@ def export_and_summarize(results, tt, curves, observed_times, observed_cum, ense
                 summary_lines.append(f"  * {cat}: {count} so far -> roughly {remaining} more to find")
             summary_lines.append("")
 
-    with open(f"{prefix}_human_summary.txt", "w", encoding="utf-8") as f:
-        f.write("\n".join(summary_lines))
-    
-    logger.info(f"Saved summary to {prefix}_human_summary.txt")
+    return summary_lines
 
-    # Generate Plots
-    plot_path = plot_reliability_growth(t, len(t), curves, results, ensemble, tt, prefix)
-    cat_plot_path = plot_categories(categorized_list, prefix)
-    intensity_plot_path = plot_failure_intensity(tt, curves_intensity, ensemble_intensity, prefix)
 
-    print("\n".join(summary_lines))
-    print(f"\nSaved files with prefix: {prefix}")
-    print(f"  * {prefix}_human_summary.txt     <- plain English explanation")
-    print(f"  * {prefix}_category_trends.csv   <- cumulative failures per category over time")
-    print(f"  * {prefix}_reliability_plot.png  <- reliability growth chart")
-    print(f"  * {prefix}_intensity_plot.png    <- failure intensity (stability) chart")
-    print(f"  * {prefix}_category_plot.png     <- Visual breakdown by category")
-    print("  * parameters.csv / predictions.csv / categorized.csv")
+def _crow_summary_lines(results, crow):
+    """Crow-AMSAA screening result and the AIC comparison of the fitted models on the same failures."""
+    if not crow:
+        return []
+    lam, beta = crow['params']
+    low, high = crow['beta']
+    pct = f"{crow['confidence']:.0%}"
+    lines = [f"Crow-AMSAA screening (power law, beta = {beta:.2f}, {pct} bounds {low:.2f} to {high:.2f}):"]
+    if high < 1:
+        lines.append("  * beta < 1: failures are arriving more slowly over time (reliability growth).")
+    elif low > 1:
+        lines.append("  * beta > 1: failures are arriving faster over time - no reliability growth; "
+                     "GO/MO projections are likely optimistic.")
+    else:
+        lines.append("  * beta is close to 1: no clear trend in the failure rate.")
+    i_low, i_high = crow['intensity']
+    lines.append(f"  * Current failure rate: {crow['current_intensity']:.3g} per hour "
+                 f"({pct} bounds {i_low:.3g} to {i_high:.3g}), about one failure every "
+                 f"{crow['current_mtbf']:.3g} hours.")
+
+    # Only AICs fitted to the same failures (see crow_screening) can be ranked
+    aics = crow.get('aic_comparison', {})
+    if len(aics) >= 2:
+        ranked = sorted(aics.items(), key=lambda kv: kv[1])
+        lines.append(f"  * Model comparison on the {crow['n']} failures after the start (lower AIC is better): "
+                     + ", ".join(f"{MODEL_NAMES.get(m, m)} {aic:.1f}" for m, aic in ranked))
+    lines.append("")
+    return lines
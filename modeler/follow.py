@@ -0,0 +1,125 @@
+
+import io
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import logging
+from .data import parse_event_frame
+
+logger = logging.getLogger(__name__)
+
+# Bytes at the start of the log used to recognise it after a copy-truncate rotation
+HEAD_BYTES = 1024
+
+
+class LogFollower:
+    """Incremental reader of a CSV failure log that only ever grows.
+
+    Remembers the byte offset, the header line and the last event reached in
+    a small JSON state file, so each :meth:`poll` parses only the complete
+    lines appended since the previous :meth:`commit`. A changed inode, a file
+    shorter than the offset or a different head means the log was rotated or
+    truncated; reading then restarts from the top of the new file.
+
+    Row sequence numbers keep increasing across rotations. After a poll,
+    ``from_start`` tells whether it read the log from its first line or
+    continued it (``EventStore.ingest_events(..., continued=...)``). Quoted
+    fields spanning several lines are not supported.
+    """
+
+    def __init__(self, csv_path: Path, state_path: Path):
+        self.csv_path = Path(csv_path)
+        self.state_path = Path(state_path)
+        self.state = self._load_state()
+        self._pending = None
+        self.from_start = None
+
+    def _load_state(self):
+        if self.state_path.is_file():
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("path") == str(self.csv_path.resolve()):
+                return state
+            logger.warning(f"State file {self.state_path} tracks another log; starting over.")
+        return {"path": str(self.csv_path.resolve()), "inode": None, "offset": 0, "head": None,
+                "head_len": 0, "header": None, "rows": 0, "rotations": 0, "last_event_ns": None}
+
+    @property
+    def source(self):
+        return self.csv_path.name
+
+    def poll(self):
+        """Parse newly appended lines; returns ``(seqs, epoch_ns, descriptions)``.
+
+        The read position only advances on :meth:`commit`, so a failed cycle
+        re-reads the same lines next time.
+        """
+        if not self.csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+        state = dict(self.state)
+        st = os.stat(self.csv_path)
+
+        with open(self.csv_path, "rb") as f:
+            if state["offset"] and self._rotated(f, st, state):
+                logger.info(f"{self.csv_path} was rotated or truncated; reading from the start.")
+                state.update(offset=0, head=None, header=None, rotations=state["rotations"] + 1)
+            f.seek(state["offset"])
+            data = f.read()
+        self.from_start = state["offset"] == 0
+
+        # Only consume complete lines; a partially written last line waits for the next poll
+        end = data.rfind(b"\n") + 1
+        data = data[:end]
+        if state["offset"] == 0 and data:
+            first_line = data.find(b"\n") + 1
+            state["header"] = data[:first_line].decode("utf-8-sig")
+            with open(self.csv_path, "rb") as f:
+                state["head"] = hashlib.sha1(f.read(min(HEAD_BYTES, st.st_size))).hexdigest()
+            state["head_len"] = min(HEAD_BYTES, st.st_size)
+            body = data[first_line:]
+        else:
+            body = data
+
+        state["inode"] = st.st_ino
+        state["offset"] += end
+        empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=object))
+        if not body.strip() or not state["header"]:
+            self._pending = state
+            return empty
+
+        df = pd.read_csv(io.StringIO(state["header"] + body.decode("utf-8")))
+        epoch_ns, descs, rows = parse_event_frame(df)
+        seqs = state["rows"] + rows
+        state["rows"] += len(df)
+        if len(epoch_ns):
+            last = int(epoch_ns.max())
+            state["last_event_ns"] = max(last, state["last_event_ns"] or last)
+        self._pending = state
+        logger.info(f"Read {len(df)} new rows ({len(epoch_ns)} events) from {self.csv_path}")
+        return seqs, epoch_ns, descs
+
+    def _rotated(self, f, st, state):
+        if state["inode"] is not None and st.st_ino != state["inode"]:
+            return True
+        if st.st_size < state["offset"]:
+            return True
+        head_len = state.get("head_len") or 0
+        if state["head"] and head_len:
+            f.seek(0)
+            return hashlib.sha1(f.read(head_len)).hexdigest() != state["head"]
+        return False
+
+    def commit(self):
+        """Persist the position reached by the last :meth:`poll`."""
+        if self._pending is None:
+            return
+        self.state = self._pending
+        self._pending = None
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp, self.state_path)
@@ -0,0 +1,126 @@
+
+import numpy as np
+import logging
+from .models import MEAN_FUNCTIONS, LOGLIK_FUNCTIONS, log_parameter_covariance
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.05, 0.5, 0.95)
+# Parameter vectors drawn per model when forecasting with parameter uncertainty
+PARAMETER_DRAWS = 4000
+
+
+def sample_parameters(params, cov, size, rng):
+    """Draw ``size`` parameter vectors around the MLE.
+
+    The log-parameters are multivariate normal around the log-MLE with
+    covariance ``cov`` (see ``models.log_parameter_covariance``), so draws stay
+    positive, follow the correlation between the parameters and have the
+    MLE as their median. Without a finite ``cov`` the parameters stay fixed.
+    """
+    params = np.asarray(params, dtype=float)
+    if cov is None or not np.all(np.isfinite(cov)):
+        return np.tile(params, (size, 1))
+    noise = rng.multivariate_normal(np.zeros(len(params)), cov, size, method='eigh')
+    return params * np.exp(noise)
+
+
+def plausible_parameters(model_name, params, se, rng, t=None, T=None, size=PARAMETER_DRAWS):
+    """Parameter vectors consistent with the data, for paths to pick from.
+
+    Proposals come from ``sample_parameters``. Where a fit is weakly
+    identified the likelihood is far from normal (GO's ``b`` near 0 on data
+    without growth), and the normal approximation reaches parameters the
+    data rule out. So with the failure times ``t`` each proposal is kept with
+    probability min(1, L(draw) / (L(MLE) * normal density ratio)), which
+    leaves a near-normal likelihood untouched and trims the rest to it.
+    Without ``t`` the parameters are uncorrelated, with sigma = SE / estimate.
+    """
+    params = np.asarray(params, dtype=float)
+    if t is None:
+        se = np.asarray(se, dtype=float) if se is not None else np.full(len(params), np.nan)
+        return sample_parameters(params, np.diag((se / params) ** 2), size, rng)
+    cov = log_parameter_covariance(model_name, params, t, T)
+    draws = sample_parameters(params, cov, size, rng)
+    if not np.all(np.isfinite(cov)):
+        return draws
+    loglik = LOGLIK_FUNCTIONS[model_name]
+    z = np.log(draws / params)
+    log_density = -0.5 * np.einsum('ij,jk,ik->i', z, np.linalg.inv(cov), z)
+    log_ratio = np.array([loglik(p, t, T) for p in draws]) - loglik(params, t, T) - log_density
+    kept = draws[np.log(rng.uniform(size=size)) < log_ratio]
+    return kept if len(kept) else params[None, :]
+
+
+def simulate_future_failures(results, T, horizons, n_paths=20000, exceed=(0,),
+                             parameter_uncertainty=True, seed=None, batch_size=10000, t=None):
+    """Monte Carlo forecast of failures in ``(T, T + h]`` for each horizon ``h``.
+
+    Paths are split evenly between the fitted models (the same weighting as
+    the ensemble curve). An NHPP has independent Poisson increments, so each
+    batch of paths is sampled exactly by drawing the counts between
+    consecutive horizons as Poisson(mu(t_k) - mu(t_{k-1})) and accumulating
+    them; with ``parameter_uncertainty`` every path first picks its own
+    parameters from ``plausible_parameters``. Pass the fitted failure times
+    ``t`` so those follow the likelihood; without them only the standard
+    errors are used.
+
+    Returns a dict with the horizons, the mean count, the ``QUANTILES`` and
+    ``P(N > k)`` for every ``k`` in ``exceed``.
+    """
+    models = [m for m in results if m in MEAN_FUNCTIONS and results[m][0] is not None]
+    if not models:
+        return None
+    horizons = np.sort(np.asarray(horizons, dtype=float))
+    exceed = np.asarray(sorted(set(int(k) for k in exceed)), dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    times = T + np.concatenate(([0.0], horizons))
+    if parameter_uncertainty:
+        pools = {m: plausible_parameters(m, results[m][0], results[m][2], rng, t, T) for m in models}
+    else:
+        pools = {m: np.asarray(results[m][0], dtype=float)[None, :] for m in models}
+
+    batches = []
+    done = 0
+    while done < n_paths:
+        size = min(batch_size, n_paths - done)
+        which = rng.integers(len(models), size=size)
+        counts = np.empty((size, len(horizons)), dtype=np.int64)
+        for i, m in enumerate(models):
+            rows = np.flatnonzero(which == i)
+            if not len(rows):
+                continue
+            draws = pools[m][rng.integers(len(pools[m]), size=len(rows))]
+            mu = MEAN_FUNCTIONS[m](times[None, :], (draws[:, :1], draws[:, 1:2]))
+            increments = np.clip(np.diff(mu, axis=1), 0, None)
+            counts[rows] = np.cumsum(rng.poisson(increments), axis=1)
+        batches.append(counts)
+        done += size
+
+    counts = np.concatenate(batches)
+    quantiles = np.quantile(counts, QUANTILES, axis=0)
+    exceedance = (counts[None, :, :] > exceed[:, None, None]).mean(axis=1)
+    return {
+        "models": models,
+        "paths": int(n_paths),
+        "parameter_uncertainty": bool(parameter_uncertainty),
+        "horizons": horizons.tolist(),
+        "mean": counts.mean(axis=0).tolist(),
+        "quantiles": {f"p{round(q * 100)}": quantiles[i].tolist() for i, q in enumerate(QUANTILES)},
+        "exceedance": {str(int(k)): exceedance[j].tolist() for j, k in enumerate(exceed)},
+    }
+
+
+def forecast_summary_lines(forecast):
+    """Plain-English summary lines for a forecast from ``simulate_future_failures``."""
+    if not forecast:
+        return []
+    lines = [f"Forecast from {forecast['paths']} simulated futures (median, 90% prediction interval):"]
+    for i, h in enumerate(forecast['horizons']):
+        low, mid, high = (forecast['quantiles'][k][i] for k in ('p5', 'p50', 'p95'))
+        lines.append(f"  * Next {h:g} hours -> about {mid:.0f} more failures "
+                     f"(between {low:.0f} and {high:.0f})")
+        for k, probs in forecast['exceedance'].items():
+            lines.append(f"      chance of more than {k} failures: {probs[i]:.0%}")
+    lines.append("")
+    return lines
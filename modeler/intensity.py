@@ -0,0 +1,72 @@
+
+import numpy as np
+from scipy.signal import fftconvolve
+from scipy.stats import norm
+import logging
+
+logger = logging.getLogger(__name__)
+
+MIN_BINS = 1024
+MAX_BINS = 2 ** 20
+BINS_PER_BANDWIDTH = 8
+# Kernel truncated at this many bandwidths; a 4-sigma cut visibly biases sparse tails
+KERNEL_REACH = 7
+
+
+def silverman_bandwidth(t):
+    """Silverman's rule of thumb, 0.9 * min(sd, IQR/1.34) * n^(-1/5), in hours."""
+    t = np.asarray(t, dtype=float)
+    n = len(t)
+    spread = np.std(t)
+    iqr = np.subtract(*np.percentile(t, [75, 25])) / 1.34
+    if iqr > 0:
+        spread = min(spread, iqr)
+    return 0.9 * spread * n ** -0.2
+
+
+def kernel_intensity(t, grid, T=None, bandwidth=None):
+    """Nonparametric failure intensity (ROCOF) on ``grid``; returns ``(intensity, bandwidth)``.
+
+    Events are linearly binned onto a regular grid over the observation window
+    ``[0, T]``, which is convolved with a Gaussian kernel by FFT, so the cost
+    is O(n + bins log bins) instead of O(n * grid). Near the window edges the
+    estimate is divided by the share of kernel mass inside the window
+    (renormalisation boundary correction). ``bandwidth`` defaults to
+    ``silverman_bandwidth``; grid points outside the window are NaN.
+    """
+    t = np.asarray(t, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+    T = float(t.max()) if T is None and len(t) else float(T or 0)
+    if len(t) < 2 or T <= 0:
+        return np.full(grid.shape, np.nan), None
+    h = bandwidth or silverman_bandwidth(t)
+    if not h > 0:
+        h = T / 100
+
+    bins = int(np.clip(2 ** np.ceil(np.log2(BINS_PER_BANDWIDTH * T / h)), MIN_BINS, MAX_BINS))
+    width = T / bins
+    # Bin centres at 0, width, ..., T so every event in the window falls between two of them
+    counts = _linear_binning(t / width, bins + 1)
+    centers = np.arange(bins + 1) * width
+
+    reach = min(bins + 1, int(np.ceil(KERNEL_REACH * h / width)))
+    offsets = np.arange(-reach, reach + 1) * width
+    smoothed = fftconvolve(counts, norm.pdf(offsets, scale=h), mode='same')
+
+    mass = norm.cdf((T - centers) / h) - norm.cdf(-centers / h)
+    estimate = np.clip(smoothed, 0, None) / mass
+
+    inside = (grid >= 0) & (grid <= T)
+    result = np.full(grid.shape, np.nan)
+    result[inside] = np.interp(grid[inside], centers, estimate)
+    logger.debug(f"Kernel intensity: {len(t)} events, {bins} bins, bandwidth {h:.4g} h")
+    return result, h
+
+
+def _linear_binning(positions, bins):
+    """Split each event between its two nearest bin centres in proportion to distance."""
+    positions = np.clip(positions, 0, bins - 1)
+    left = np.minimum(positions.astype(np.int64), bins - 2)
+    frac = positions - left
+    return (np.bincount(left, weights=1 - frac, minlength=bins)
+            + np.bincount(left + 1, weights=frac, minlength=bins))
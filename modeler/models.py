@@ -1,10 +1,15 @@
 
 import numpy as np
-from scipy.optimize import minimize
+import functools
+from scipy.optimize import minimize, brentq
+from scipy.stats import chi2, norm, gamma
 import logging
 
 logger = logging.getLogger(__name__)
 
+ENGINES = ('profile', 'multistart')
+MODEL_NAMES = {'go': 'Goel-Okumoto', 'mo': 'Musa-Okumoto', 'ca': 'Crow-AMSAA'}
+
 def go_loglik(params, t, T):
     a, b = params
     if a <= 0 or b <= 0: return -np.inf
@@ -41,42 +46,318 @@ def mo_intensity(t, params):
     return lambda0 / (1 + lambda0 * theta * t)
 
 
-def numerical_hessian(fun, x, args=(), eps=1e-5):
+def ca_loglik(params, t, T):
+    lam, beta = params
+    if lam <= 0 or beta <= 0: return -np.inf
+    t = np.asarray(t, dtype=float)
+    t = t[t > 0]
+    n = len(t)
+    return n * np.log(lam * beta) + (beta - 1) * np.sum(np.log(t)) - lam * T ** beta
+
+
+def ca_mu(t, params):
+    """Crow-AMSAA (power-law) mean value function: mu(t) = lambda * t^beta"""
+    lam, beta = params
+    return lam * np.power(t, beta)
+
+
+def ca_intensity(t, params):
+    """Calculates failure intensity (rate) for Crow-AMSAA model: lambda(t) = lambda * beta * t^(beta-1)"""
+    lam, beta = params
+    with np.errstate(divide='ignore'):
+        return lam * beta * np.power(t, beta - 1)
+
+
+def ca_mle(t, T):
+    """Closed-form MLE: beta = n / sum(ln(T/t_i)), lambda = n / T^beta.
+
+    The same formula covers failure-terminated data (T is the last failure,
+    whose ln(T/t_n) term is zero). Failures at the time origin (the first
+    failure when no start time is given) define the start of the
+    observation and are not modelled.
+    Returns ``(params, se)`` with SEs from the inverse Fisher information,
+    or ``(None, None)`` when there are fewer than three failures after 0.
+    """
+    t = np.asarray(t, dtype=float)
+    t = t[(t > 0) & (t <= T)]
+    n = len(t)
+    if n < 3:
+        return None, None
+    log_ratio = np.sum(np.log(T / t))
+    if log_ratio <= 0:
+        return None, None
+    beta = n / log_ratio
+    lam = n / T ** beta
+    se = np.array([lam * np.sqrt((1 + (beta * np.log(T)) ** 2) / n), beta / np.sqrt(n)])
+    return np.array([lam, beta]), se
+
+
+def crow_bounds(params, n, T, confidence=0.95, failure_truncated=False):
+    """Crow confidence bounds for a Crow-AMSAA fit on ``n`` failures.
+
+    Time-terminated (observation stopped at ``T``): 2n*beta/beta_hat is
+    chi-square with 2n degrees of freedom, and the current MTBF and
+    intensity at ``T`` use Crow's large-sample approximation
+    MTBF / (1 -+ z/sqrt(2n))^2.
+
+    Failure-terminated (``T`` is the n-th failure): the chi-square has
+    2(n-1) degrees of freedom and the true/estimated MTBF ratio is exactly
+    distributed as n^2 / (X * G), X ~ Gamma(n), G ~ Gamma(n-1), whose
+    quantiles come from ``_mtbf_ratio_quantiles``.
+    """
+    lam, beta = params
+    alpha = 1 - confidence
+    intensity = float(ca_intensity(T, params))
+    mtbf = 1 / intensity
+    df = 2 * (n - 1) if failure_truncated else 2 * n
+    if failure_truncated:
+        low, high = _mtbf_ratio_quantiles(n, (alpha / 2, 1 - alpha / 2))
+        mtbf_lower, mtbf_upper = mtbf * low, mtbf * high
+    else:
+        z = norm.ppf(1 - alpha / 2)
+        mtbf_lower = mtbf / (1 + z / np.sqrt(2 * n)) ** 2
+        mtbf_upper = mtbf / (1 - z / np.sqrt(2 * n)) ** 2 if z < np.sqrt(2 * n) else np.inf
+    return {
+        "confidence": confidence,
+        "failure_truncated": failure_truncated,
+        "beta": [float(beta * chi2.ppf(alpha / 2, df) / (2 * n)),
+                 float(beta * chi2.ppf(1 - alpha / 2, df) / (2 * n))],
+        "current_intensity": intensity,
+        "intensity": [float(1 / mtbf_upper), float(1 / mtbf_lower)],
+        "current_mtbf": float(mtbf),
+        "mtbf": [float(mtbf_lower), float(mtbf_upper)],
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _mtbf_ratio_quantiles(n, probs, nodes=400):
+    """Quantiles of R = n^2 / (X * G) with independent X ~ Gamma(n), G ~ Gamma(n-1).
+
+    P(X * G <= x) is averaged over ``nodes`` equal-probability points of G
+    (midpoint rule in probability) and inverted with Brent's method; ~2 ms
+    per quantile and within 0.1% of adaptive quadrature.
+    """
+    g = gamma.ppf((np.arange(nodes) + 0.5) / nodes, n - 1)
+    centre, spread = n * (n - 1.0), np.sqrt(2.0 / n)
+    quantiles = []
+    for p in probs:
+        # R <= r  <=>  X * G >= n^2 / r
+        root = brentq(lambda x: np.mean(gamma.cdf(x / g, n)) - (1 - p),
+                      centre * np.exp(-12 * spread), centre * np.exp(12 * spread), rtol=1e-10)
+        quantiles.append(n * n / root)
+    return quantiles
+
+
+def crow_screening(t, T, confidence=0.95, compare=None):
+    """Crow-AMSAA fit with its AIC and Crow bounds, or ``None``; cheap enough to run on every analysis.
+
+    The fit leaves out failures at the time origin, so its likelihood is not
+    comparable with GO/MO fits that include them. ``compare`` maps other
+    models to their fitted parameters; ``aic_comparison`` then holds the AIC
+    of Crow-AMSAA and of each of them on the same failures (see
+    ``aic_after_origin``). Bounds are failure-terminated when ``max(t) == T``.
+    """
+    params, se = ca_mle(t, T)
+    if params is None:
+        return None
+    t = np.asarray(t, dtype=float)
+    events = t[(t > 0) & (t <= T)]
+    n = len(events)
+    ll = float(ca_loglik(params, events, T))
+    aics = {'ca': 4 - 2 * ll}
+    for m, fitted in (compare or {}).items():
+        aics[m] = aic_after_origin(t, T, m, fitted)
+    return {"params": params.tolist(), "se": se.tolist(), "loglik": ll, "aic": aics['ca'], "n": n,
+            "aic_comparison": aics,
+            **crow_bounds(params, n, T, confidence, failure_truncated=bool(events.max() >= T))}
+
+
+def aic_after_origin(t, T, model_name, params):
+    """AIC of a fitted model scored on the failures after the time origin only.
+
+    Crow-AMSAA cannot score a failure at t = 0, so this is the event set on
+    which all models are comparable. The log-likelihood is evaluated at
+    ``params`` rather than refitted; leaving out a failure or two moves the
+    MLE by O(1/n), far less than the AIC differences worth ranking.
+    """
+    t = np.asarray(t, dtype=float)
+    events = t[(t > 0) & (t <= T)]
+    return 2 * len(params) - 2 * float(LOGLIK_FUNCTIONS[model_name](params, events, T))
+
+
+def go_mu_inverse(m, params):
+    """Time at which GO expects ``m`` failures; inf once ``m`` reaches the total ``a``."""
+    a, b = params
+    m = np.asarray(m, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(m < a, -np.log1p(-m / a) / b, np.inf)
+
+
+def mo_mu_inverse(m, params):
+    lambda0, theta = params
+    return np.expm1(theta * np.asarray(m, dtype=float)) / (lambda0 * theta)
+
+
+def ca_mu_inverse(m, params):
+    lam, beta = params
+    return np.power(np.asarray(m, dtype=float) / lam, 1 / beta)
+
+
+def go_intensity_inverse(y, params):
+    """Earliest time from which the GO intensity stays below ``y`` (0 if it starts below)."""
+    a, b = params
+    with np.errstate(divide='ignore'):
+        return np.clip(np.log(a * b / np.asarray(y, dtype=float)) / b, 0, None)
+
+
+def mo_intensity_inverse(y, params):
+    lambda0, theta = params
+    return np.clip((lambda0 / np.asarray(y, dtype=float) - 1) / (lambda0 * theta), 0, None)
+
+
+def ca_intensity_inverse(y, params):
+    """Like ``go_intensity_inverse``; a non-decreasing power law (beta >= 1) never drops, giving inf."""
+    lam, beta = params
+    y = np.asarray(y, dtype=float)
+    if beta >= 1:
+        return np.where((beta == 1) & (lam < y), 0.0, np.inf)
+    return np.power(y / (lam * beta), 1 / (beta - 1))
+
+
+MEAN_FUNCTIONS = {'go': go_mu, 'mo': mo_mu, 'ca': ca_mu}
+INTENSITY_FUNCTIONS = {'go': go_intensity, 'mo': mo_intensity, 'ca': ca_intensity}
+MEAN_INVERSES = {'go': go_mu_inverse, 'mo': mo_mu_inverse, 'ca': ca_mu_inverse}
+INTENSITY_INVERSES = {'go': go_intensity_inverse, 'mo': mo_intensity_inverse, 'ca': ca_intensity_inverse}
+LOGLIK_FUNCTIONS = {'go': go_loglik, 'mo': mo_loglik, 'ca': ca_loglik}
+
+
+def numerical_hessian(fun, x, args=(), eps=1e-4):
+    """Central-difference Hessian with steps relative to each parameter's size.
+
+    Parameters here span many orders of magnitude (a ~ 1e2..1e5, b ~ 1e-3),
+    so a fixed absolute step drowns the second differences in rounding error.
+    """
+    x = np.asarray(x, dtype=float)
     n = len(x)
+    h = eps * np.maximum(np.abs(x), 1e-8)
     H = np.zeros((n, n))
     f0 = fun(x, *args)
     for i in range(n):
-        x1 = x.copy(); x1[i] += eps
-        x2 = x.copy(); x2[i] -= eps
+        x1 = x.copy(); x1[i] += h[i]
+        x2 = x.copy(); x2[i] -= h[i]
         f1 = fun(x1, *args)
         f2 = fun(x2, *args)
-        H[i,i] = (f1 - 2*f0 + f2) / (eps**2)
+        H[i,i] = (f1 - 2*f0 + f2) / (h[i]**2)
         for j in range(i+1, n):
-            x11 = x.copy(); x11[i] += eps; x11[j] += eps
-            x12 = x.copy(); x12[i] += eps; x12[j] -= eps
-            x21 = x.copy(); x21[i] -= eps; x21[j] += eps
-            x22 = x.copy(); x22[i] -= eps; x22[j] -= eps
+            x11 = x.copy(); x11[i] += h[i]; x11[j] += h[j]
+            x12 = x.copy(); x12[i] += h[i]; x12[j] -= h[j]
+            x21 = x.copy(); x21[i] -= h[i]; x21[j] += h[j]
+            x22 = x.copy(); x22[i] -= h[i]; x22[j] -= h[j]
             f11 = fun(x11, *args)
             f12 = fun(x12, *args)
             f21 = fun(x21, *args)
             f22 = fun(x22, *args)
-            H[i,j] = H[j,i] = (f11 - f12 - f21 + f22) / (4 * eps**2)
+            H[i,j] = H[j,i] = (f11 - f12 - f21 + f22) / (4 * h[i] * h[j])
     return H
 
 
-def fit_model(t, T, model_name='go', method='L-BFGS-B', tol=1e-10):
+def go_profile_mle(t, T):
+    """GO MLE from the profile likelihood in ``b``; ``None`` when no finite MLE exists.
+
+    For fixed ``b`` the likelihood is maximised by a = n / (1 - exp(-bT)), and
+    the score in ``b`` becomes n/b - nT/(exp(bT) - 1) - sum(t) = 0. In terms
+    of x = bT this is 1/x - 1/(exp(x) - 1) = mean(t)/T, whose left side falls
+    from 1/2 to 0, so a root exists only when mean(t) < T/2 (reliability
+    growth) and is found by Brent's method.
+    """
+    n = len(t)
+    c = np.mean(t) / T
+    if not 0 < c < 0.5:
+        return None
+    score = lambda x: 1 / x - 1 / np.expm1(x) - c
+    x = brentq(score, 1e-6, 2 / c, xtol=1e-12)
+    b = x / T
+    return np.array([n / -np.expm1(-x), b])
+
+
+def mo_profile_mle(t, T):
+    """MO MLE from the profile likelihood in beta = lambda0 * theta; ``None`` when it has no root.
+
+    With nu = 1/theta the mean is nu * ln(1 + beta t) and, for fixed beta,
+    nu = n / ln(1 + beta T). The profile score in x = beta T,
+    1/x - 1/((1 + x) ln(1 + x)) - mean(u / (1 + x u)) with u = t/T, starts at
+    1/2 - mean(u) and turns negative for large x, so it is bracketed by
+    doubling and solved by Brent's method.
+    """
+    n = len(t)
+    u = np.asarray(t, dtype=float) / T
+    if not 0 < np.mean(u) < 0.5:
+        return None
+    score = lambda x: 1 / x - 1 / ((1 + x) * np.log1p(x)) - np.mean(u / (1 + x * u))
+    hi = 1.0
+    while score(hi) > 0:
+        hi *= 2
+        if hi > 1e12:
+            return None
+    x = brentq(score, 1e-6, hi, xtol=1e-12)
+    theta = np.log1p(x) / n
+    return np.array([x / T / theta, theta])
+
+
+PROFILE_SOLVERS = {'go': go_profile_mle, 'mo': mo_profile_mle}
+
+
+def fit_model(t, T, model_name='go', method='L-BFGS-B', tol=1e-10, progress=None, engine='profile'):
+    """Fit a GO, MO or Crow-AMSAA (``'ca'``) model by maximum likelihood.
+
+    Crow-AMSAA has a closed-form MLE (``ca_mle``) and never iterates. For GO
+    and MO the default ``engine='profile'`` reduces the fit to a 1-D root search
+    (see ``go_profile_mle`` / ``mo_profile_mle``) and only falls back to the
+    multi-start 2-D search with ``method`` when that has no solution;
+    ``engine='multistart'`` always runs the multi-start search.
+
+    ``progress`` is an optional callback ``progress(stage, **info)`` invoked
+    after each optimizer start.
+    """
     n = len(t)
     if n < 3:
         logger.warning("Not enough data points to fit model (n < 3).")
         return None, None, None, None
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown fit engine: {engine}. Choose from: {', '.join(ENGINES)}")
+
+    if model_name == 'ca':
+        params, se = ca_mle(t, T)
+        if params is None:
+            logger.warning("Failed to fit ca model.")
+            return None, None, None, None
+        ll = ca_loglik(params, t, T)
+        if progress:
+            progress("fit", model=model_name, start=1, starts=1, success=True,
+                     best_loglik=float(ll), engine="closed-form")
+        # The power law has no finite number of total failures
+        return params, ll, se, None
+
+    loglik_func = go_loglik if model_name == 'go' else mo_loglik
+    if engine == 'profile':
+        try:
+            best_params = PROFILE_SOLVERS[model_name](t, T) if T > 0 else None
+        except (ValueError, FloatingPointError) as e:
+            logger.debug(f"Profile likelihood solve failed for {model_name}: {e}")
+            best_params = None
+        best_ll = loglik_func(best_params, t, T) if best_params is not None else -np.inf
+        if np.isfinite(best_ll):
+            if progress:
+                progress("fit", model=model_name, start=1, starts=1, success=True,
+                         best_loglik=float(best_ll), engine="profile")
+            return _finish_fit(model_name, loglik_func, best_params, best_ll, t, T)
+        logger.info(f"No profile likelihood solution for {model_name}; using multi-start search.")
 
     if model_name == 'go':
-        loglik_func = go_loglik
         initials = [[n*1.2, 0.05], [n*1.5, 0.03], [n*2.0, 0.08], [n*1.1, 0.2], [n*3.0, 0.1]]
         bounds = [(max(1, n*0.5), None), (1e-6, None)]
         mu_func = go_mu
     else:
-        loglik_func = mo_loglik
         lambda0_guess = n / T * np.array([0.5, 1.0, 2.0, 3.0]) if T > 0 else np.array([10,50,100])
         theta_guess = np.array([0.005, 0.01, 0.05, 0.1, 0.2])
         initials = [[l0, th] for l0 in lambda0_guess for th in theta_guess]
@@ -84,7 +365,7 @@ def fit_model(t, T, model_name='go', method='L-BFGS-B', tol=1e-10):
         mu_func = mo_mu
 
     best_ll, best_params = -np.inf, None
-    for x0 in initials:
+    for i, x0 in enumerate(initials):
         res = minimize(lambda p: -loglik_func(p, t, T), x0, bounds=bounds,
                        method=method, tol=tol)
         if res.success:
@@ -92,19 +373,44 @@ def fit_model(t, T, model_name='go', method='L-BFGS-B', tol=1e-10):
             if ll > best_ll:
                 best_ll = ll
                 best_params = res.x
+        if progress:
+            progress("fit", model=model_name, start=i + 1, starts=len(initials),
+                     success=bool(res.success),
+                     best_loglik=float(best_ll) if best_params is not None else None,
+                     engine="multistart")
 
     if best_params is None:
         logger.warning(f"Failed to fit {model_name} model.")
         return None, None, None, None
 
+    return _finish_fit(model_name, loglik_func, best_params, best_ll, t, T)
+
+
+def log_parameter_covariance(model_name, params, t, T):
+    """Covariance of the log-parameters at the MLE ``params``, from the observed information.
+
+    Working on log scale keeps positive parameters positive and captures the
+    strong correlation between them (e.g. GO's ``a`` and ``b`` on data with
+    little growth, where only their product is well determined).
+    Returns a matrix of NaN when the information is not invertible.
+    """
+    params = np.asarray(params, dtype=float)
+    loglik_func = LOGLIK_FUNCTIONS[model_name]
     try:
-        neg_ll = lambda p: -loglik_func(p, t, T)
-        H = numerical_hessian(neg_ll, best_params, args=(t, T))
+        H = numerical_hessian(lambda u: -loglik_func(np.exp(u), t, T), np.log(params))
         cov = np.linalg.inv(H)
-        se = np.sqrt(np.diag(cov))
+        if not np.all(np.isfinite(cov)) or np.any(np.diag(cov) <= 0):
+            raise np.linalg.LinAlgError("information matrix is not positive definite")
+        return cov
     except Exception as e:
         logger.debug(f"Hessian calculation failed for {model_name}: {e}")
-        se = np.full(len(best_params), np.nan)
+        return np.full((len(params), len(params)), np.nan)
+
+
+def _finish_fit(model_name, loglik_func, best_params, best_ll, t, T):
+    """Standard errors and expected total failures for a fitted parameter vector."""
+    # Delta method: SE(p) = p * SE(log p)
+    se = best_params * np.sqrt(np.diag(log_parameter_covariance(model_name, best_params, t, T)))
 
     if model_name == 'go':
         total_expected = best_params[0]
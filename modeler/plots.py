@@ -1,18 +1,24 @@
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import logging
-from collections import Counter
+import threading
+from .events import as_event_table
+from .models import MODEL_NAMES
 
 logger = logging.getLogger(__name__)
 
+# pyplot keeps global state, so only one thread may render at a time
+PLOT_LOCK = threading.Lock()
+
 def plot_reliability_growth(t, n, curves, results, ensemble, tt, prefix):
     try:
         plt.figure(figsize=(10,6))
         plt.plot(t, np.arange(1, n+1), 'o', label=f'Observed ({n})', alpha=0.7)
         for m, curve in curves.items():
-            label = results[m][3] if m in results else m
+            label = MODEL_NAMES.get(m, m)
             plt.plot(tt, curve, label=label)
         
         if ensemble is not None:
@@ -35,7 +41,7 @@ def plot_reliability_growth(t, n, curves, results, ensemble, tt, prefix):
         return None
 
 
-def plot_failure_intensity(tt, curves_intensity, ensemble_intensity, prefix):
+def plot_failure_intensity(tt, curves_intensity, ensemble_intensity, prefix, empirical=None):
     try:
         plt.figure(figsize=(10, 6))
         
@@ -46,6 +52,9 @@ def plot_failure_intensity(tt, curves_intensity, ensemble_intensity, prefix):
         if ensemble_intensity is not None:
             plt.plot(tt, ensemble_intensity, '--', linewidth=2.5, label='Ensemble Intensity')
 
+        if empirical is not None:
+            plt.plot(tt, empirical, ':', color='black', linewidth=2, label='Empirical (kernel estimate)')
+
         plt.xlabel('Time (hours)')
         plt.ylabel('Failures per Hour (Intensity)')
         plt.title('Failure Intensity over Time (Rate of Occurrence)')
@@ -65,20 +74,14 @@ def plot_failure_intensity(tt, curves_intensity, ensemble_intensity, prefix):
 def plot_categories(categorized_list, prefix):
     try:
         # Prepare data
-        cat_counts = Counter()
-        for row in categorized_list:
-            cats = row[2].split(", ")
-            for c in cats:
-                cat_counts[c] += 1
+        events = as_event_table(categorized_list)
+        cat_counts = events.category_counts()
         
         # Sort by count (descending)
         sorted_cats = cat_counts.most_common()
         cat_names = [x[0] for x in sorted_cats]
         cat_vals = [x[1] for x in sorted_cats]
 
-        # Trend data
-        cat_df = pd.DataFrame(categorized_list, columns=['Original_Timestamp', 'Time_Hours', 'Categories', 'Description'])
-        
         # Get unique categories and times
         all_cats = sorted(list(set(cat_names)))
         
@@ -86,14 +89,13 @@ def plot_categories(categorized_list, prefix):
         labels = []
         time_grid = np.array([])
         
-        if not cat_df.empty:
-            max_time = cat_df['Time_Hours'].max()
+        if len(events):
+            max_time = events.hours.max()
             time_grid = np.linspace(0, max_time, 200)
             
             for cat in all_cats:
                 # Filter events for this category
-                cat_events = cat_df[cat_df['Categories'].apply(lambda x: cat in x.split(", "))]
-                event_times = np.sort(cat_events['Time_Hours'].values)
+                event_times = np.sort(events.hours[events.category_mask(cat)])
                 
                 # Calculate cumulative counts at each time step in time_grid
                 counts = np.searchsorted(event_times, time_grid, side='right')
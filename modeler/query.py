@@ -0,0 +1,81 @@
+
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+import logging
+from .models import MEAN_FUNCTIONS, INTENSITY_FUNCTIONS, MEAN_INVERSES, INTENSITY_INVERSES
+from .series import compact_list
+
+logger = logging.getLogger(__name__)
+
+
+def fit_record(fits, t0, T, n, category_counts):
+    """JSON-ready summary of an analysis that ``answer_queries`` can work from.
+
+    ``fits`` maps model ids to ``fit_model`` results; ``category_counts`` is
+    the observed number of failures per category.
+    """
+    return {
+        "start_time": pd.Timestamp(t0).isoformat(),
+        "duration_hours": float(T),
+        "failures": int(n),
+        "models": {m: {"params": [float(p) for p in params], "loglik": float(ll),
+                       "total_expected": float(total) if total is not None else None}
+                   for m, (params, ll, se, total) in fits.items() if params is not None},
+        "categories": {name: int(count) for name, count in category_counts.items()},
+    }
+
+
+def answer_queries(record, hours=(), dates=(), intensity_below=(), reach=(), categories=False, models=None):
+    """Read points off the fitted curves of ``record`` (from ``fit_record``) for many inputs at once.
+
+    * ``hours`` / ``dates``: expected cumulative (and additional) failures at
+      those times, in hours since the start or as timestamps.
+    * ``intensity_below``: when each model's intensity drops, and stays, below each rate.
+    * ``reach``: when each cumulative failure count is expected to be reached.
+    * ``categories``: remaining failures per category, for models with a finite total.
+
+    Times are returned as hours since the start, hours from the end of the
+    data and timestamps; ``None`` means never.
+    """
+    t0 = datetime.fromisoformat(record["start_time"])
+    T, n = record["duration_hours"], record["failures"]
+    points = np.asarray(hours, dtype=float)
+    if len(dates):
+        stamps = pd.to_datetime(pd.Series(list(dates)), utc=True, format='mixed')
+        points = np.concatenate([points, (stamps - pd.Timestamp(t0)).dt.total_seconds().to_numpy() / 3600])
+    thresholds = np.asarray(intensity_below, dtype=float)
+    counts = np.asarray(reach, dtype=float)
+
+    answers = {}
+    for m, fit in record["models"].items():
+        if models and m not in models:
+            continue
+        params = fit["params"]
+        answer = {}
+        if len(points):
+            mean = MEAN_FUNCTIONS[m](points, params)
+            answer["expected_failures"] = {"hours": compact_list(points, 6), "mean": compact_list(mean, 6),
+                                           "additional": compact_list(np.clip(mean - n, 0, None), 6)}
+        if len(thresholds):
+            answer["intensity_below"] = {"rate": compact_list(thresholds, 6),
+                                         **_times(INTENSITY_INVERSES[m](thresholds, params), t0, T)}
+        if len(counts):
+            answer["reach"] = {"failures": compact_list(counts, 6), **_times(MEAN_INVERSES[m](counts, params), t0, T)}
+        if categories and fit["total_expected"] is not None:
+            remaining = max(0.0, fit["total_expected"] - n)
+            seen = sum(record["categories"].values()) or 1
+            answer["remaining_by_category"] = {name: round(remaining * count / seen, 2)
+                                               for name, count in record["categories"].items()}
+        answer["current_intensity"] = float(INTENSITY_FUNCTIONS[m](T, params))
+        answers[m] = answer
+    return answers
+
+
+def _times(at, t0, T):
+    at = np.asarray(at, dtype=float)
+    # Beyond the last representable date (year 9999) a date means nothing anyway
+    latest = (datetime.max.replace(tzinfo=t0.tzinfo) - t0).total_seconds() / 3600
+    dated = np.isfinite(at) & (at < latest)
+    stamps = [(t0 + timedelta(hours=h)).isoformat() if ok else None for h, ok in zip(at.tolist(), dated)]
+    return {"hours": compact_list(at, 6), "from_now_hours": compact_list(np.clip(at - T, 0, None), 6), "date": stamps}
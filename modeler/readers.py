@@ -0,0 +1,161 @@
+
+import io
+import bz2
+import gzip
+import json
+import lzma
+import pandas as pd
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ROWS = 100_000
+FORMATS = ('auto', 'csv', 'jsonl')
+
+# Magic bytes -> decompressing stream opener
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+COMPRESSION_SUFFIXES = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+JSONL_SUFFIXES = ('.jsonl', '.ndjson', '.json')
+
+BOMS = (
+    (b"\xef\xbb\xbf", "utf-8-sig"),
+    (b"\xff\xfe", "utf-16"),
+    (b"\xfe\xff", "utf-16"),
+)
+
+TIME_KEYS = ['date', 'time', 'datetime', 'logged', 'timestamp']
+DESC_KEYS = ['desc', 'error', 'fault', 'message', 'msg', 'detail']
+
+
+def open_log(path: Path):
+    """Open a log as a text stream, decompressing gzip/bz2/xz on the fly.
+
+    Compression is recognised by magic bytes, the text encoding by its BOM
+    (UTF-8 without BOM otherwise). Nothing is decompressed to disk.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        magic = f.read(6)
+    opener = next((op for sig, op in COMPRESSION_MAGIC if magic.startswith(sig)), open)
+    stream = opener(path, "rb")
+    head = stream.peek(4)[:4]
+    encoding = next((enc for bom, enc in BOMS if head.startswith(bom)), "utf-8")
+    return io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
+
+
+def log_suffix(path: Path):
+    """Suffix of the log itself, ignoring a compression suffix (``a.jsonl.gz`` -> ``.jsonl``)."""
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes = suffixes[:-1]
+    return suffixes[-1] if suffixes else ""
+
+
+def detect_format(path: Path):
+    """'jsonl' for JSON-lines logs (by suffix or a first line holding a JSON object), else 'csv'."""
+    if log_suffix(path) in JSONL_SUFFIXES:
+        return 'jsonl'
+    with open_log(path) as f:
+        for line in f:
+            if line.strip():
+                return 'jsonl' if _json_object(line) is not None else 'csv'
+    return 'csv'
+
+
+def iter_log_chunks(path: Path, fmt='auto', time_field=None, desc_field=None, chunksize=CHUNK_ROWS):
+    """Yield DataFrames of at most ``chunksize`` rows from a CSV or JSON-lines log."""
+    fmt = detect_format(path) if fmt == 'auto' else fmt
+    if fmt == 'jsonl':
+        yield from iter_jsonl_chunks(path, time_field, desc_field, chunksize)
+    elif fmt == 'csv':
+        with open_log(path) as f:
+            yield from pd.read_csv(f, chunksize=chunksize)
+    else:
+        raise ValueError(f"Unknown log format: {fmt}. Choose from: {', '.join(FORMATS)}")
+
+
+def iter_jsonl_chunks(path: Path, time_field=None, desc_field=None, chunksize=CHUNK_ROWS):
+    """Yield two-column (timestamp, description) DataFrames from a JSON-lines log.
+
+    Each line may carry a prefix before the JSON object, such as the
+    ``service  | `` added by ``docker compose logs``; lines without a JSON
+    object are skipped. Fields default to the first key that looks like a
+    timestamp / description, and dotted names reach into nested objects.
+    """
+    skipped = 0
+    rows = []
+    detected = False
+    with open_log(path) as f:
+        for line in f:
+            record = _json_object(line)
+            if record is None:
+                skipped += bool(line.strip())
+                continue
+            if not detected:
+                time_field = time_field or _pick_field(record, TIME_KEYS)
+                desc_field = desc_field or _pick_field(record, DESC_KEYS, exclude=time_field)
+                if time_field is None:
+                    raise ValueError(f"No timestamp field found in {path}; pass time_field explicitly")
+                logger.debug(f"JSON-lines fields - Timestamp: {time_field}, Description: {desc_field}")
+                detected = True
+            rows.append((_timestamp(_lookup(record, time_field)),
+                         _lookup(record, desc_field) if desc_field else ""))
+            if len(rows) >= chunksize:
+                yield _jsonl_frame(rows, time_field, desc_field)
+                rows = []
+    if rows:
+        yield _jsonl_frame(rows, time_field, desc_field)
+    if skipped:
+        logger.warning(f"Skipped {skipped} non-JSON lines in {path}")
+
+
+def _jsonl_frame(rows, time_field, desc_field):
+    return pd.DataFrame(rows, columns=[time_field or 'timestamp', desc_field or 'description'], dtype=object)
+
+
+def _timestamp(value):
+    """Numeric timestamps are epoch seconds (or milliseconds when that large)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        unit = 'ms' if abs(value) > 1e11 else 's'
+        return pd.Timestamp(value, unit=unit, tz='UTC').isoformat()
+    return value
+
+
+def _json_object(line):
+    start = line.find("{")
+    if start < 0:
+        return None
+    try:
+        record = json.loads(line[start:])
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _pick_field(record, keys, exclude=None):
+    flat = _flatten(record)
+    return next((k for k in flat if k != exclude and any(key in k.lower() for key in keys)), None)
+
+
+def _flatten(record, prefix=""):
+    names = []
+    for k, v in record.items():
+        if isinstance(v, dict):
+            names.extend(_flatten(v, f"{prefix}{k}."))
+        else:
+            names.append(f"{prefix}{k}")
+    return names
+
+
+def _lookup(record, field):
+    value = record
+    for part in field.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
@@ -0,0 +1,78 @@
+
+import numpy as np
+import logging
+from .events import as_event_table
+
+logger = logging.getLogger(__name__)
+
+# Default number of points per chart series sent to clients
+MAX_POINTS = 1000
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling; returns the kept indices.
+
+    The first and last points are always kept. The points in between are
+    split into ``n_out - 2`` equal buckets and from each bucket the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket is kept, which preserves peaks and the overall
+    shape of the series far better than taking every k-th point.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def step_series(times, max_points=MAX_POINTS):
+    """Cumulative failure count at each (sorted) event time, decimated with ``lttb``."""
+    times = np.asarray(times, dtype=float)
+    cum = np.arange(1, len(times) + 1)
+    idx = lttb(times, cum, max_points)
+    return {"time_hours": compact_list(times[idx]), "cumulative": cum[idx].tolist(), "points": len(times)}
+
+
+def chart_series(t, tt, curves, curves_intensity, events, max_points=MAX_POINTS):
+    """Everything the reliability, intensity and category charts draw, as plain arrays.
+
+    Model curves are already on the ``tt`` grid; the observed and
+    per-category cumulative counts are decimated to ``max_points``.
+    """
+    events = as_event_table(events)
+    categories = []
+    for name, count in events.category_counts().most_common():
+        series = step_series(events.hours[events.category_mask(name)], max_points)
+        categories.append({"name": name, "count": count, **series})
+    return {
+        "time_hours": compact_list(tt),
+        "models": {m: {"mu": compact_list(curves[m]), "intensity": compact_list(curves_intensity[m], 6)}
+                   for m in curves},
+        "observed": step_series(t, max_points),
+        "categories": categories,
+    }
+
+
+def compact_list(values, decimals=4):
+    """Rounded list; non-finite values (e.g. a power-law intensity at t=0) become ``None``."""
+    values = np.round(np.asarray(values, dtype=float), decimals)
+    finite = np.isfinite(values)
+    if finite.all():
+        return values.tolist()
+    return [v if ok else None for v, ok in zip(values.tolist(), finite.tolist())]
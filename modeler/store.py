@@ -0,0 +1,210 @@
+
+import sqlite3
+import hashlib
+import numpy as np
+from pathlib import Path
+import logging
+from .data import (load_fault_categories, categorize_description, read_log_events,
+                   build_failure_events, to_epoch_ns)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS descriptions (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    epoch_ns INTEGER NOT NULL,
+    desc_id INTEGER NOT NULL REFERENCES descriptions(id),
+    occurrence INTEGER NOT NULL,
+    UNIQUE (source, epoch_ns, desc_id, occurrence)
+);
+CREATE INDEX IF NOT EXISTS idx_events_time ON events (epoch_ns);
+CREATE INDEX IF NOT EXISTS idx_events_source_time ON events (source, epoch_ns);
+CREATE TABLE IF NOT EXISTS description_categories (
+    category TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    desc_id INTEGER NOT NULL REFERENCES descriptions(id),
+    PRIMARY KEY (category, rank, desc_id)
+) WITHOUT ROWID;
+"""
+
+
+class EventStore:
+    """Append-only SQLite store of parsed failure events.
+
+    Events are keyed by content: ``(source, time, description, occurrence)``
+    where ``occurrence`` numbers identical events within one log. Re-ingesting
+    a file, a longer copy of it or the next day's log under the same name
+    therefore only adds the events not seen before. Descriptions are interned
+    and their categories are indexed per description, which keeps category
+    filters cheap; the category index is rebuilt whenever the fault taxonomy
+    changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, csv_path: Path, fault_categories, source: str = None, progress=None, **reader):
+        """Parse a log and append its new rows; returns the number of events added.
+
+        ``reader`` is passed to ``read_log_events`` (format and field names).
+        """
+        epoch_ns, descs, _ = read_log_events(Path(csv_path), progress, **reader)
+        return self.ingest_events(source or Path(csv_path).name, epoch_ns, descs, fault_categories)
+
+    def ingest_events(self, source: str, epoch_ns, descs, fault_categories, continued=False):
+        """Append parsed events of ``source``; events already stored are skipped.
+
+        An event's occurrence is its index among the identical ones (same
+        time and description) before it in the log. ``continued`` marks the
+        next lines of a log whose earlier lines are already stored, like a
+        ``LogFollower`` poll: occurrences then count on from the stored
+        events, so a repeat is still added and the keys match a full ingest.
+        """
+        self.sync_categories(fault_categories)
+        with self.conn:
+            desc_ids = self._intern(descs, fault_categories)
+            occurrences = _occurrences(epoch_ns, desc_ids)
+            if continued:
+                occurrences += self._stored_counts(source, epoch_ns, desc_ids)
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO events (source, epoch_ns, desc_id, occurrence) VALUES (?, ?, ?, ?)",
+                ((source, int(ns), d, int(k)) for ns, d, k in zip(epoch_ns, desc_ids, occurrences)))
+            added = self.conn.total_changes - before
+        logger.info(f"Ingested {added} new events from {source} ({len(desc_ids) - added} already stored)")
+        return added
+
+    def _stored_counts(self, source, epoch_ns, desc_ids):
+        """Number of stored events of ``source`` identical to each given event."""
+        counts = {}
+        for key in zip(map(int, epoch_ns), desc_ids):
+            if key not in counts:
+                counts[key] = self.conn.execute(
+                    "SELECT COUNT(*) FROM events WHERE source = ? AND epoch_ns = ? AND desc_id = ?",
+                    (source, *key)).fetchone()[0]
+        return np.array([counts[key] for key in zip(map(int, epoch_ns), desc_ids)], dtype=np.int64)
+
+    def _intern(self, descs, fault_categories):
+        uniques = list(dict.fromkeys(descs))
+        ids = {}
+        for text in uniques:
+            row = self.conn.execute("SELECT id FROM descriptions WHERE text = ?", (text,)).fetchone()
+            if row is None:
+                desc_id = self.conn.execute("INSERT INTO descriptions (text) VALUES (?)", (text,)).lastrowid
+                self._index_categories(desc_id, text, fault_categories)
+            else:
+                desc_id = row[0]
+            ids[text] = desc_id
+        return [ids[text] for text in descs]
+
+    def _index_categories(self, desc_id, text, fault_categories):
+        cats = categorize_description(text, fault_categories, multi_label=True)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO description_categories (category, rank, desc_id) VALUES (?, ?, ?)",
+            ((cat, rank, desc_id) for rank, cat in enumerate(cats)))
+
+    def sync_categories(self, fault_categories):
+        """Re-index description categories if the taxonomy differs from the stored one."""
+        fingerprint = _taxonomy_fingerprint(fault_categories)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'taxonomy'").fetchone()
+        if row and row[0] == fingerprint:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM description_categories")
+            for desc_id, text in self.conn.execute("SELECT id, text FROM descriptions").fetchall():
+                self._index_categories(desc_id, text, fault_categories)
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('taxonomy', ?)", (fingerprint,))
+        if row:
+            logger.info("Fault taxonomy changed; re-indexed stored description categories.")
+
+    def query(self, since=None, until=None, sources=None, categories=None, multi_label=False):
+        """Epoch-ns and descriptions of matching events, in time order.
+
+        The time bounds and sources are answered from the event indexes; a
+        category filter matches an event's primary category, or any of its
+        categories when ``multi_label`` is set.
+        """
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("e.epoch_ns >= ?"); params.append(to_epoch_ns(since))
+        if until is not None:
+            clauses.append("e.epoch_ns < ?"); params.append(to_epoch_ns(until))
+        if sources:
+            clauses.append(f"e.source IN ({', '.join('?' * len(sources))})"); params.extend(sources)
+        if categories:
+            rank = "" if multi_label else " AND rank = 0"
+            clauses.append(f"e.desc_id IN (SELECT desc_id FROM description_categories "
+                           f"WHERE category IN ({', '.join('?' * len(categories))}){rank})")
+            params.extend(categories)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT e.epoch_ns, d.text FROM events e JOIN descriptions d ON d.id = e.desc_id "
+            f"{where} ORDER BY e.epoch_ns, e.id", params).fetchall()
+        if not rows:
+            return np.array([], dtype=np.int64), np.array([], dtype=object)
+        epoch_ns, descs = zip(*rows)
+        return np.array(epoch_ns, dtype=np.int64), np.array(descs, dtype=object)
+
+    def sources(self):
+        """Stored sources with their event counts and time span (epoch ns)."""
+        return self.conn.execute(
+            "SELECT source, COUNT(*), MIN(epoch_ns), MAX(epoch_ns) FROM events GROUP BY source").fetchall()
+
+
+def load_store_data(store_path: Path, config_path: Path, start_time_str: str = None,
+                    multi_label: bool = False, progress=None, since=None, until=None,
+                    sources=None, categories=None):
+    """``load_failure_data`` counterpart that reads a window of an :class:`EventStore`."""
+    fault_categories = load_fault_categories(config_path)
+    if not Path(store_path).exists():
+        logger.error(f"Event store not found: {store_path}")
+        raise FileNotFoundError(f"Event store not found: {store_path}")
+    with EventStore(store_path) as store:
+        store.sync_categories(fault_categories)
+        epoch_ns, descs = store.query(since, until, sources, categories, multi_label)
+    logger.info(f"Read {len(epoch_ns)} events from {store_path}")
+    if progress: progress("read", rows=len(epoch_ns))
+    return build_failure_events(epoch_ns, descs, fault_categories, start_time_str,
+                                multi_label, progress)
+
+
+def _occurrences(epoch_ns, desc_ids):
+    """Index of each event among the identical (same time and description) events before it."""
+    epoch_ns = np.asarray(epoch_ns, dtype=np.int64)
+    desc_ids = np.asarray(desc_ids, dtype=np.int64)
+    n = len(epoch_ns)
+    if n == 0:
+        return np.array([], dtype=np.int64)
+    order = np.lexsort((np.arange(n), desc_ids, epoch_ns))
+    e, d = epoch_ns[order], desc_ids[order]
+    starts = np.flatnonzero(np.r_[True, (e[1:] != e[:-1]) | (d[1:] != d[:-1])])
+    run_start = np.repeat(starts, np.diff(np.r_[starts, n]))
+    occurrences = np.empty(n, dtype=np.int64)
+    occurrences[order] = np.arange(n) - run_start
+    return occurrences
+
+
+def _taxonomy_fingerprint(fault_categories):
+    canonical = repr([(name, sorted(kws)) for name, kws in (fault_categories or [])])
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,89 @@
+
+import numpy as np
+from scipy.stats import chi2, norm
+import logging
+
+logger = logging.getLogger(__name__)
+
+# What to do with the GO/MO fits when neither test finds reliability growth
+GATES = ('off', 'flag', 'skip')
+
+
+def trend_tests(t, T, alpha=0.05, failure_truncated=None):
+    """Laplace and MIL-HDBK-189 tests for reliability growth on failure times ``t`` in (0, T].
+
+    Both only need n, sum(t) and sum(ln t), taken in one pass over ``t``
+    without any fitting. Failures at the time origin mark the start of the
+    observation and are left out, as in the Crow-AMSAA fit.
+
+    * Laplace: U = (mean(t) - T/2) / (T * sqrt(1/(12m))) is standard normal
+      without a trend; a negative U means failures are thinning out.
+    * MIL-HDBK-189: 2 * sum(ln(T/t_i)) is chi-square with 2m degrees of
+      freedom for a constant rate and large under growth (it is 2m/beta of
+      the power-law fit).
+
+    When observation stopped at the last failure (``failure_truncated``,
+    detected from ``max(t) == T`` by default) that failure is not random:
+    both statistics use only the m = n - 1 earlier times. Otherwise m = n.
+
+    P-values are one-sided for growth. ``growth`` is true when either test
+    is significant at ``alpha``; ``None`` is returned for fewer than 3 failures.
+    """
+    t = np.asarray(t, dtype=float)
+    t = t[(t > 0) & (t <= T)]
+    n = len(t)
+    if n < 3 or T <= 0:
+        return None
+    if failure_truncated is None:
+        failure_truncated = bool(t.max() >= T)
+    if failure_truncated:
+        t = np.delete(t, np.argmax(t))
+    m = len(t)
+    sum_t = float(np.sum(t))
+    sum_log = float(np.sum(np.log(t)))
+
+    laplace = (sum_t / m - T / 2) / (T * np.sqrt(1 / (12 * m)))
+    mil = 2 * (m * np.log(T) - sum_log)
+    result = {
+        "n": n,
+        "alpha": alpha,
+        "failure_truncated": failure_truncated,
+        "laplace": {"statistic": float(laplace), "p_value": float(norm.cdf(laplace))},
+        "mil_hdbk_189": {"statistic": float(mil), "df": 2 * m, "p_value": float(chi2.sf(mil, 2 * m))},
+    }
+    result["growth"] = bool(min(result["laplace"]["p_value"], result["mil_hdbk_189"]["p_value"]) < alpha)
+    return result
+
+
+def trend_summary_lines(trend, gate='off'):
+    """Plain-English summary lines for ``trend_tests`` and what the ``gate`` did about it."""
+    if not trend:
+        return []
+    laplace, mil = trend['laplace'], trend['mil_hdbk_189']
+    lines = ["Is reliability improving? (trend tests, small p-value = yes)",
+             f"  * Laplace test: U = {laplace['statistic']:.2f}, p = {laplace['p_value']:.3g}",
+             f"  * MIL-HDBK-189 test: chi-square = {mil['statistic']:.1f} on {mil['df']} df, "
+             f"p = {mil['p_value']:.3g}"]
+    if trend['growth']:
+        lines.append(f"  * Significant reliability growth at the {trend['alpha']:g} level.")
+    elif gate == 'skip':
+        lines.append("  * No significant growth: GO/MO fits were skipped (growth models do not apply).")
+    elif gate == 'flag':
+        lines.append("  * WARNING: no significant growth - treat the GO/MO projections with caution.")
+    else:
+        lines.append("  * No significant reliability growth detected.")
+    lines.append("")
+    return lines
+
+
+def trend_rows(trend):
+    """One row per test for the trend export."""
+    if not trend:
+        return []
+    return [
+        {"Test": "Laplace", "Statistic": trend['laplace']['statistic'], "DF": np.nan,
+         "P_Value_Growth": trend['laplace']['p_value'], "N": trend['n']},
+        {"Test": "MIL-HDBK-189", "Statistic": trend['mil_hdbk_189']['statistic'],
+         "DF": trend['mil_hdbk_189']['df'], "P_Value_Growth": trend['mil_hdbk_189']['p_value'],
+         "N": trend['n']},
+    ]
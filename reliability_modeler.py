@@ -8,14 +8,19 @@ import argparse
 import numpy as np
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
 
 # Import modules
-from modeler.data import load_failure_data
-from modeler.models import fit_model, go_mu, mo_mu
-from modeler.export import export_and_summarize
+from modeler.data import load_failure_data, load_fault_categories
+from modeler.store import EventStore, load_store_data
+from modeler.follow import LogFollower
+from modeler.readers import FORMATS
+from modeler.trend import trend_tests, GATES
+from modeler.models import fit_model, crow_screening, ENGINES, MEAN_FUNCTIONS, MODEL_NAMES
+from modeler.forecast import simulate_future_failures
+from modeler.export import export_and_summarize, select_outputs, OUTPUTS
 
 def setup_logging(silent=False, output_dir=None):
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -34,27 +39,73 @@ def setup_logging(silent=False, output_dir=None):
 
 def main():
     parser = argparse.ArgumentParser(description="Reliability Growth Modeler v1.0.0")
-    parser.add_argument('--csv', default='input/error_log.csv')
+    parser.add_argument('--csv', default='input/error_log.csv',
+                        help="Failure log: CSV or JSON-lines, optionally .gz/.bz2/.xz compressed")
+    parser.add_argument('--format', choices=FORMATS, default='auto', help="Log format (default: detect)")
+    parser.add_argument('--time-field', default=None, help="Timestamp column / JSON field (dotted for nested)")
+    parser.add_argument('--desc-field', default=None, help="Description column / JSON field (dotted for nested)")
     parser.add_argument('--config', default='fault_categories.conf')
-    parser.add_argument('--model', choices=['go','mo','both'], default='both')
+    parser.add_argument('--model', choices=['go','mo','ca','both','all'], default='both',
+                        help="both = GO + MO; all = GO + MO + Crow-AMSAA (ca)")
+    parser.add_argument('--trend-gate', choices=GATES, default='flag',
+                        help="When trend tests find no reliability growth: off = fit anyway, "
+                             "flag = fit and warn (default), skip = do not fit GO/MO")
+    parser.add_argument('--trend-alpha', type=float, default=0.05, help="Significance level of the trend tests")
+    parser.add_argument('--fit-engine', choices=ENGINES, default='profile',
+                        help="profile: 1-D profile-likelihood solve (multi-start fallback); multistart: 2-D search")
     parser.add_argument('--start-time', default=None)
     parser.add_argument('--multi-label', action='store_true')
     parser.add_argument('--silent', action='store_true')
     parser.add_argument('--export-only', action='store_true')
     parser.add_argument('--prefix', default=None)
     parser.add_argument('--output-dir', default='output', help="Directory to save output files")
+    parser.add_argument('--outputs', default=None,
+                        help=f"Comma-separated outputs to write (default: all). Choices: {', '.join(OUTPUTS)}")
+    parser.add_argument('--no-plots', action='store_true', help="Skip all PNG plots (matplotlib is not imported)")
+    parser.add_argument('--store', default=None, help="SQLite event store to analyse instead of --csv")
+    parser.add_argument('--ingest', action='store_true', help="Append new --csv rows to --store before analysing")
+    parser.add_argument('--source', action='append', default=None,
+                        help="Only analyse events from this store source (repeatable)")
+    parser.add_argument('--category', action='append', default=None,
+                        help="Only analyse events in this category (repeatable, needs --store)")
+    parser.add_argument('--since', default=None, help="Only analyse events at or after this time")
+    parser.add_argument('--until', default=None, help="Only analyse events before this time")
+    parser.add_argument('--forecast-hours', default='24,168,720',
+                        help="Comma-separated horizons (hours after the last failure) to forecast; empty disables")
+    parser.add_argument('--forecast-exceed', default='0',
+                        help="Comma-separated failure counts N; reports P(more than N failures) per horizon")
+    parser.add_argument('--forecast-paths', type=int, default=20000, help="Number of simulated failure paths")
+    parser.add_argument('--follow', action='store_true',
+                        help="Watch --csv and re-analyse whenever rows are appended (uses --store, default <output-dir>/events.sqlite)")
+    parser.add_argument('--state-file', default=None,
+                        help="Follow position file (default <output-dir>/follow_state.json)")
+    parser.add_argument('--interval', type=float, default=900, help="Seconds between follow cycles")
+    parser.add_argument('--once', action='store_true', help="Run a single follow cycle and exit (for cron)")
 
     args = parser.parse_args()
 
-    # Setup Directory
-    # Create Year/Month/Day structure
-    now = datetime.now()
-    date_path = now.strftime("%Y/%m/%d")  # e.g., 2026/02/17
-    
-    # Base output dir from args, then append date structure
-    base_output_dir = Path(args.output_dir)
-    output_dir = base_output_dir / date_path
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if args.ingest and not args.store:
+        parser.error("--ingest requires --store")
+    if (args.source or args.category) and not args.store:
+        parser.error("--source and --category require --store")
+
+    try:
+        args.forecast_hours = [float(h) for h in args.forecast_hours.split(',') if h]
+        args.forecast_exceed = [int(k) for k in args.forecast_exceed.split(',') if k]
+    except ValueError:
+        parser.error("--forecast-hours and --forecast-exceed take comma-separated numbers")
+
+    try:
+        outputs = select_outputs(args.outputs.split(',') if args.outputs else None, plots=not args.no_plots)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.follow:
+        if args.since or args.until or args.source or args.category:
+            parser.error("--follow analyses the whole followed log; drop the window filters")
+        args.store = args.store or str(Path(args.output_dir) / "events.sqlite")
+
+    output_dir = dated_output_dir(args.output_dir)
 
     # Setup Logging
     silent = args.silent or args.export_only
@@ -64,15 +115,82 @@ def main():
     if not silent:
         print("Reliability Modeler v1.0.0")
 
+    if args.follow:
+        follow(args, outputs, logger)
+        return
+
     try:
-        t, categorized, t0, fault_categories = load_failure_data(
-            Path(args.csv), Path(args.config), args.start_time,
-            multi_label=args.multi_label
-        )
+        if args.ingest:
+            with EventStore(Path(args.store)) as store:
+                store.ingest(Path(args.csv), load_fault_categories(Path(args.config)), **reader_options(args))
+        loaded = load_events(args)
     except Exception as e:
         logger.critical(f"Data loading failed: {e}")
         return
 
+    run_analysis(args, outputs, output_dir, loaded, logger)
+
+def dated_output_dir(base):
+    # Create Year/Month/Day structure
+    now = datetime.now()
+    date_path = now.strftime("%Y/%m/%d")  # e.g., 2026/02/17
+    
+    # Base output dir from args, then append date structure
+    output_dir = Path(base) / date_path
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+def load_events(args, sources=None):
+    if args.store:
+        return load_store_data(
+            Path(args.store), Path(args.config), args.start_time,
+            multi_label=args.multi_label, since=args.since, until=args.until,
+            sources=sources or args.source, categories=args.category
+        )
+    return load_failure_data(
+        Path(args.csv), Path(args.config), args.start_time,
+        multi_label=args.multi_label, since=args.since, until=args.until, **reader_options(args)
+    )
+
+def reader_options(args):
+    return {"fmt": args.format, "time_field": args.time_field, "desc_field": args.desc_field}
+
+def follow(args, outputs, logger):
+    """Tail-follow --csv: ingest only appended rows into --store and refresh the outputs.
+
+    Runs forever, one cycle every --interval seconds, or a single cycle with
+    --once (for cron); the read position lives in --state-file between runs.
+    """
+    state_file = Path(args.state_file or Path(args.output_dir) / "follow_state.json")
+    follower = LogFollower(Path(args.csv), state_file)
+    # A fresh follower has no previous outputs to keep, so analyse on the first cycle
+    refresh = not state_file.exists()
+    while True:
+        try:
+            _, epoch_ns, descs = follower.poll()
+            with EventStore(Path(args.store)) as store:
+                # Appended lines are keyed as a full --ingest of the log would key them
+                added = store.ingest_events(follower.source, epoch_ns, descs,
+                                            load_fault_categories(Path(args.config)),
+                                            continued=not follower.from_start)
+            follower.commit()
+            if added or refresh:
+                # The store may hold other logs too; only the followed one is analysed
+                loaded = load_events(args, sources=[follower.source])
+                run_analysis(args, outputs, dated_output_dir(args.output_dir), loaded, logger)
+            else:
+                logger.info("No new events; outputs are up to date.")
+            refresh = False
+        except Exception as e:
+            # Retry the analysis next cycle even if no further rows arrive
+            refresh = True
+            logger.error(f"Follow cycle failed: {e}")
+        if args.once:
+            return
+        time.sleep(args.interval)
+
+def run_analysis(args, outputs, output_dir, loaded, logger):
+    t, categorized, t0, fault_categories = loaded
     t = np.sort(t)
     T = float(t[-1]) if len(t) > 0 else 0.0
     n = len(t)
@@ -80,8 +198,20 @@ def main():
     logger.info(f"{n} failures | T = {T:.2f} hours (since {t0})")
 
     models_to_fit = []
-    if args.model in ['go', 'both']: models_to_fit.append('go')
-    if args.model in ['mo', 'both']: models_to_fit.append('mo')
+    if args.model in ['go', 'both', 'all']: models_to_fit.append('go')
+    if args.model in ['mo', 'both', 'all']: models_to_fit.append('mo')
+    if args.model in ['ca', 'all']: models_to_fit.append('ca')
+
+    trend = trend_tests(t, T, args.trend_alpha)
+    if trend:
+        logger.info(f"Trend tests: Laplace p = {trend['laplace']['p_value']:.3g}, "
+                    f"MIL-HDBK-189 p = {trend['mil_hdbk_189']['p_value']:.3g}")
+    if trend and not trend['growth'] and args.trend_gate != 'off':
+        if args.trend_gate == 'skip':
+            logger.warning("No significant reliability growth; skipping the GO/MO fits.")
+            models_to_fit = [m for m in models_to_fit if m not in ('go', 'mo')]
+        else:
+            logger.warning("No significant reliability growth; GO/MO results are unreliable.")
 
     results = {}
     curves = {}
@@ -89,17 +219,26 @@ def main():
 
     for m in models_to_fit:
         logger.info(f"Fitting model: {m}")
-        params, ll, se, total_exp = fit_model(t, T, m)
+        params, ll, se, total_exp = fit_model(t, T, m, engine=args.fit_engine)
         if params is not None:
-            name = "Goel-Okumoto" if m == 'go' else "Musa-Okumoto"
+            name = MODEL_NAMES[m]
             aic = 4 - 2*ll
             logger.info(f"{name}: AIC = {aic:.2f}")
             results[m] = (params, ll, se, total_exp)
-            curves[m] = go_mu(tt, params) if m == 'go' else mo_mu(tt, params)
+            curves[m] = MEAN_FUNCTIONS[m](tt, params)
 
     ensemble = None
-    if len(curves) == 2:
-        ensemble = (curves['go'] + curves['mo']) / 2
+    if len(curves) >= 2:
+        ensemble = np.mean(list(curves.values()), axis=0)
+
+    # The closed-form power-law fit is free, so every run is screened with it
+    compare = {m: r[0] for m, r in results.items() if m != 'ca'} if 'summary' in outputs else None
+    crow = crow_screening(t, T, compare=compare)
+
+    forecast = None
+    if args.forecast_hours and 'summary' in outputs and results:
+        forecast = simulate_future_failures(results, T, args.forecast_hours, args.forecast_paths,
+                                            exceed=args.forecast_exceed, t=t)
 
     # Output Prefix
     prefix = args.prefix or datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -107,7 +246,8 @@ def main():
 
     # Export
     export_and_summarize(results, tt, curves, t, np.arange(1,n+1), ensemble,
-                         categorized, prefix, fault_categories, t, T)
+                         categorized, prefix, fault_categories, t, T, outputs=outputs,
+                         forecast=forecast, crow=crow, trend=trend, trend_gate=args.trend_gate)
     
     logger.info("Analysis complete.")
 
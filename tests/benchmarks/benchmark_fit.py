@@ -0,0 +1,46 @@
+
+"""Timing of the GO/MO fit engines on simulated logs of increasing size.
+
+Run from the project root: python tests/benchmarks/benchmark_fit.py
+"""
+import sys
+import os
+import time
+import numpy as np
+
+# Add root to sys.path
+sys.path.append(os.getcwd())
+
+from modeler.models import fit_model, ENGINES
+
+SIZES = [100, 1_000, 10_000, 100_000]
+REPEATS = 3
+
+
+def simulate_go(n, b=0.02, T=100.0, seed=0):
+    """``n`` failure times of a GO process observed on (0, T]."""
+    rng = np.random.default_rng(seed)
+    return np.sort(-np.log1p(-rng.uniform(0, -np.expm1(-b * T), n)) / b), T
+
+
+def best_time(func, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+if __name__ == "__main__":
+    print(f"{'model':<6}{'n':>9}" + "".join(f"{e + ' ms':>16}" for e in ENGINES) + f"{'speedup':>10}{'dLogLik':>12}")
+    for n in SIZES:
+        t, T = simulate_go(n)
+        for m in ['go', 'mo']:
+            timings, lls = [], []
+            for engine in ENGINES:
+                seconds, (params, ll, se, total) = best_time(lambda: fit_model(t, T, m, engine=engine))
+                timings.append(seconds)
+                lls.append(ll)
+            print(f"{m:<6}{n:>9}" + "".join(f"{s * 1000:>16.2f}" for s in timings)
+                  + f"{timings[1] / timings[0]:>9.0f}x{lls[0] - lls[1]:>12.2e}")
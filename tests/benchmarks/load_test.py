@@ -0,0 +1,120 @@
+"""Latency and throughput of the pre-forked API as the number of workers varies.
+
+For each worker count a local server is started with gunicorn.conf.py, warmed
+up, and then hit by concurrent clients for a fixed time; p50/p99 latency and
+requests per second are reported per worker count. With --url an already
+running instance is measured once instead.
+
+Run from the project root (needs gunicorn and uvicorn-worker):
+    python tests/benchmarks/load_test.py --workers 1,2,4 --clients 8 --duration 20
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+API_DIR = os.path.join(os.getcwd(), "web", "api")
+# Plots are rendered by default since that is where the memory growth is
+DEFAULT_PATH = "/sample-data"
+STARTUP_SECONDS = 60
+
+
+def start_server(workers, port, max_requests):
+    # The modeler package lives in the project root, outside the API directory
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(port), MAX_REQUESTS=str(max_requests),
+               PYTHONPATH=os.getcwd())
+    return subprocess.Popen([sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+                            cwd=API_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_ready(base, server):
+    deadline = time.monotonic() + STARTUP_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            urllib.request.urlopen(base + "/config", timeout=2).read()
+            return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not start within {STARTUP_SECONDS} s")
+
+
+def fetch(url):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=120) as response:
+            response.read()
+        ok = True
+    except (urllib.error.URLError, ConnectionError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def run_load(url, clients, duration):
+    """``clients`` closed-loop clients for ``duration`` seconds; returns (latencies, errors, seconds)."""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop = time.monotonic() + duration
+
+    def client():
+        while time.monotonic() < stop:
+            seconds, ok = fetch(url)
+            with lock:
+                if ok:
+                    latencies.append(seconds)
+                else:
+                    errors[0] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        for _ in range(clients):
+            pool.submit(client)
+    return np.array(latencies), errors[0], time.perf_counter() - start
+
+
+def report(label, latencies, errors, seconds):
+    if len(latencies):
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    else:
+        p50 = p99 = float("nan")
+    print(f"{label:>8}{len(latencies):>10}{errors:>8}{p50:>12.1f}{p99:>12.1f}{len(latencies) / seconds:>12.2f}",
+          flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts to compare")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of load per worker count")
+    parser.add_argument("--warmup", type=int, default=4, help="Untimed requests per worker count")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="Endpoint to request, e.g. '/sample-data?render=data'")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-requests", type=int, default=500, help="Worker recycling interval")
+    parser.add_argument("--url", default=None, help="Measure this running instance instead of starting servers")
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'requests':>10}{'errors':>8}{'p50 ms':>12}{'p99 ms':>12}{'req/s':>12}")
+    if args.url:
+        for _ in range(args.warmup):
+            fetch(args.url.rstrip("/") + args.path)
+        report("-", *run_load(args.url.rstrip("/") + args.path, args.clients, args.duration))
+        sys.exit()
+
+    for workers in [int(w) for w in args.workers.split(",")]:
+        base = f"http://127.0.0.1:{args.port}"
+        server = start_server(workers, args.port, args.max_requests)
+        try:
+            wait_ready(base, server)
+            for _ in range(args.warmup):
+                fetch(base + args.path)
+            report(str(workers), *run_load(base + args.path, args.clients, args.duration))
+        finally:
+            server.terminate()
+            server.wait()
@@ -1,6 +1,6 @@
 
 import pytest
-from modeler.data import categorize_description
+from modeler.data import categorize_description, load_fault_categories
 
 def test_categorize_basic():
     categories = [('Database', {'db', 'sql'}), ('UI', {'button', 'css'})]
@@ -27,3 +27,14 @@ def test_categorize_multi_label():
     # Since 'Database' is first in list, it should return that or High Priority depending on loop
     # The current logic matches in order of definition
     assert categorize_description(desc, categories, multi_label=False) == "Database"
+
+def test_fault_categories_reloaded_only_when_changed(tmp_path):
+    config = tmp_path / "fault_categories.conf"
+    config.write_text("Database [db, sql]\n", encoding="utf-8")
+
+    first = load_fault_categories(config)
+    assert first == (("Database", frozenset({"db", "sql"})),)
+    assert load_fault_categories(config) is first
+
+    config.write_text("Database [db, sql]\nUI [button]\n", encoding="utf-8")
+    assert [name for name, _ in load_fault_categories(config)] == ["Database", "UI"]
@@ -0,0 +1,31 @@
+
+import numpy as np
+from modeler.events import EventTable, as_event_table
+
+CATEGORIES = [('Database', {'db', 'sql'}), ('Network', {'timeout', 'socket'})]
+
+def _table(multi_label=False):
+    descs = np.array(["SQL timeout", "socket closed", "SQL timeout", "nothing"], dtype=object)
+    epoch_ns = np.array([0, 3600, 7200, 10800], dtype=np.int64) * 10**9
+    return EventTable.build(epoch_ns, epoch_ns / 3.6e12, descs, CATEGORIES, multi_label)
+
+def test_single_label_records():
+    table = _table()
+    assert len(table) == 4
+    assert table[0] == ('1970-01-01T00:00:00+00:00', 0.0, 'Database', 'SQL timeout')
+    assert table[-1][2] == 'Other / Uncategorized'
+    assert [row[2] for row in table[1:3]] == ['Network', 'Database']
+    # Interned descriptions: the repeated text is stored once
+    assert len(table.descriptions) == 3
+
+def test_multi_label_counts_and_masks():
+    table = _table(multi_label=True)
+    assert table[0][2] == 'Database, Network'
+    assert table.category_counts() == {'Database': 2, 'Network': 3, 'Other / Uncategorized': 1}
+    assert table.category_mask('Network').tolist() == [True, True, True, False]
+
+def test_round_trip_from_records():
+    table = _table(multi_label=True)
+    rebuilt = as_event_table(table.to_records())
+    assert rebuilt.to_records() == table.to_records()
+    assert table.to_frame()['Categories'].tolist() == [row[2] for row in table]
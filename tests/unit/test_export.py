@@ -0,0 +1,29 @@
+
+import json
+import numpy as np
+import pytest
+from modeler.export import export_and_summarize, select_outputs, OUTPUTS, PLOT_OUTPUTS
+from modeler.models import go_mu
+
+def test_select_outputs():
+    assert select_outputs() == OUTPUTS
+    assert select_outputs(['predictions', 'parameters']) == ('parameters', 'predictions')
+    assert not set(select_outputs(plots=False)) & set(PLOT_OUTPUTS)
+    with pytest.raises(ValueError):
+        select_outputs(['nope'])
+
+def test_export_writes_only_selected_outputs(tmp_path):
+    t = np.array([0.0, 1.0, 2.5, 4.0, 7.0])
+    T = float(t[-1])
+    params = np.array([10.0, 0.1])
+    results = {'go': (params, -10.0, np.array([1.0, 0.01]), 10.0)}
+    tt = np.linspace(0, T * 1.6, 20)
+    prefix = str(tmp_path / "run")
+
+    manifest = export_and_summarize(results, tt, {'go': go_mu(tt, params)}, t, np.arange(1, 6), None,
+                                    [], prefix, None, t, T, outputs=['parameters'])
+
+    assert [e['name'] for e in manifest['outputs']] == ['parameters']
+    assert manifest['outputs'][0]['status'] == 'written'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['run_manifest.json', 'run_parameters.csv']
+    assert json.loads((tmp_path / 'run_manifest.json').read_text())['skipped'] == list(OUTPUTS[1:])
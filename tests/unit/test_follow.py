@@ -0,0 +1,35 @@
+
+from modeler.follow import LogFollower
+
+HEADER = "Date Time Of Error,Error or Fault Description\n"
+
+def test_follower_reads_only_appended_lines(tmp_path):
+    log, state = tmp_path / "log.csv", tmp_path / "state.json"
+    log.write_text(HEADER + "2025-01-01 00:00:00,first\n2025-01-01 01:00:00,sec")
+
+    follower = LogFollower(log, state)
+    seqs, epoch_ns, descs = follower.poll()
+    assert list(descs) == ["first"]  # the incomplete last line waits
+    follower.commit()
+
+    with open(log, "a") as f:
+        f.write("ond\n2025-01-01 02:00:00,third\n")
+    follower = LogFollower(log, state)  # resumed from the state file, as under cron
+    seqs, epoch_ns, descs = follower.poll()
+    assert list(descs) == ["second", "third"]
+    assert list(seqs) == [1, 2]
+    follower.commit()
+    assert follower.poll()[0].size == 0
+
+def test_follower_restarts_after_truncation(tmp_path):
+    log, state = tmp_path / "log.csv", tmp_path / "state.json"
+    log.write_text(HEADER + "2025-01-01 00:00:00,old one\n2025-01-01 01:00:00,old two\n")
+    follower = LogFollower(log, state)
+    follower.poll()
+    follower.commit()
+
+    log.write_text(HEADER + "2025-02-01 00:00:00,new\n")
+    seqs, _, descs = follower.poll()
+    assert list(descs) == ["new"]
+    # Sequence numbers keep increasing so store keys never collide
+    assert list(seqs) == [2]
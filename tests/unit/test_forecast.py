@@ -0,0 +1,48 @@
+
+import numpy as np
+from modeler.forecast import simulate_future_failures
+from modeler.models import go_mu, fit_model
+
+def test_forecast_matches_expected_counts():
+    params = np.array([200.0, 0.01])
+    results = {'go': (params, 0.0, np.array([np.nan, np.nan]), 200.0)}
+    T, horizons = 50.0, [10.0, 100.0]
+    forecast = simulate_future_failures(results, T, horizons, n_paths=40000, exceed=(0, 30), seed=0)
+
+    expected = go_mu(T + np.array(horizons), params) - go_mu(T, params)
+    assert np.allclose(forecast['mean'], expected, rtol=0.02)
+    assert forecast['quantiles']['p5'][0] <= forecast['quantiles']['p50'][0] <= forecast['quantiles']['p95'][0]
+    # More failures are always at least as likely over a longer horizon
+    assert forecast['exceedance']['30'][0] <= forecast['exceedance']['30'][1]
+
+def test_parameter_uncertainty_widens_intervals():
+    params = np.array([200.0, 0.01])
+    results = {'go': (params, 0.0, np.array([40.0, 0.002]), 200.0)}
+    fixed = simulate_future_failures(results, 50.0, [100.0], 20000, parameter_uncertainty=False, seed=1)
+    mixed = simulate_future_failures(results, 50.0, [100.0], 20000, parameter_uncertainty=True, seed=1)
+    width = lambda f: f['quantiles']['p95'][0] - f['quantiles']['p5'][0]
+    assert width(mixed) > width(fixed)
+
+def test_fitted_standard_errors_feed_parameter_uncertainty():
+    rng = np.random.default_rng(3)
+    b, T = 0.02, 100.0
+    t = np.sort(-np.log1p(-rng.uniform(0, -np.expm1(-b * T), 300)) / b)
+    results = {m: fit_model(t, T, m) for m in ['go', 'mo']}
+    for params, ll, se, total in results.values():
+        assert np.all(np.isfinite(se)) and np.all(se > 0)
+
+    fixed = simulate_future_failures(results, T, [200.0], 20000, parameter_uncertainty=False, seed=1)
+    mixed = simulate_future_failures(results, T, [200.0], 20000, parameter_uncertainty=True, seed=1)
+    width = lambda f: f['quantiles']['p95'][0] - f['quantiles']['p5'][0]
+    assert width(mixed) > width(fixed)
+
+def test_weakly_identified_fit_keeps_the_median():
+    # A constant failure rate: GO and MO fit, but their parameters are nearly unidentified
+    rng = np.random.default_rng(5)
+    T = 100.0
+    t = np.sort(rng.uniform(0, T, 1500))
+    results = {m: fit_model(t, T, m) for m in ['go', 'mo']}
+    fixed = simulate_future_failures(results, T, [24.0, 168.0], 20000, parameter_uncertainty=False, seed=1)
+    mixed = simulate_future_failures(results, T, [24.0, 168.0], 20000, parameter_uncertainty=True, seed=1, t=t)
+    assert np.allclose(mixed['quantiles']['p50'], fixed['quantiles']['p50'], rtol=0.05)
+    assert np.all(np.array(mixed['quantiles']['p5']) > 0.8 * np.array(fixed['quantiles']['p5']))
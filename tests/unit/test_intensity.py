@@ -0,0 +1,23 @@
+
+import numpy as np
+from scipy.stats import norm
+from modeler.intensity import kernel_intensity
+
+def test_kernel_intensity_matches_direct_sum():
+    rng = np.random.default_rng(0)
+    t = np.sort(rng.exponential(30, 2000))
+    T = float(t[-1])
+    grid = np.linspace(0, T * 1.5, 50)
+    estimate, h = kernel_intensity(t, grid, T)
+
+    inside = grid <= T
+    direct = [norm.pdf(x - t, scale=h).sum() / (norm.cdf((T - x) / h) - norm.cdf(-x / h))
+              for x in grid[inside]]
+    assert np.allclose(estimate[inside], direct, rtol=5e-3)
+    assert np.isnan(estimate[~inside]).all()
+
+def test_boundary_correction_keeps_constant_rate_flat():
+    # 10 failures per hour over 200 hours, evenly spread
+    t = np.linspace(0, 200, 2001)
+    estimate, _ = kernel_intensity(t, np.array([0.0, 100.0, 200.0]), 200.0, bandwidth=10.0)
+    assert np.allclose(estimate, 10.0, rtol=0.02)
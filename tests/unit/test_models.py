@@ -1,7 +1,8 @@
 
 import pytest
 import numpy as np
-from modeler.models import go_mu, mo_mu, go_loglik
+from modeler.models import (go_mu, mo_mu, go_loglik, fit_model, ca_mu, ca_loglik, crow_bounds, crow_screening,
+                            ca_mle)
 
 def test_go_mu():
     # Test Goel-Okumoto mean value function
@@ -36,3 +37,81 @@ def test_go_loglik_invalid_params():
     T = 5
     assert go_loglik([-10, 0.1], t, T) == -np.inf
     assert go_loglik([100, -0.1], t, T) == -np.inf
+
+def test_fit_model_reports_progress():
+    rng = np.random.default_rng(0)
+    t = np.sort(rng.exponential(20, 40))
+    events = []
+    fit_model(t, float(t[-1]), 'go', progress=lambda stage, **info: events.append((stage, info)),
+              engine='multistart')
+    assert [e[0] for e in events] == ['fit'] * 5
+    assert events[-1][1]['start'] == events[-1][1]['starts'] == 5
+
+def _go_sample(a, b, T, seed):
+    rng = np.random.default_rng(seed)
+    n = rng.poisson(a * (1 - np.exp(-b * T)))
+    return np.sort(-np.log1p(-rng.uniform(0, -np.expm1(-b * T), n)) / b)
+
+@pytest.mark.parametrize("model", ['go', 'mo'])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_profile_engine_matches_multistart(model, seed):
+    t = _go_sample(300, 0.02, 100.0, seed)
+    profile = fit_model(t, 100.0, model)
+    multistart = fit_model(t, 100.0, model, engine='multistart')
+    assert profile[1] >= multistart[1] - 1e-8
+    assert np.allclose(profile[0], multistart[0], rtol=1e-4)
+    assert np.all(np.isfinite(profile[2])) and np.all(np.isfinite(multistart[2]))
+    assert np.allclose(profile[2], multistart[2], rtol=1e-2)
+
+def test_profile_engine_falls_back_without_growth():
+    # Increasing failure rate: mean(t) > T/2, so the profile score has no root
+    t = 100.0 * np.sqrt(np.linspace(0.01, 1, 60))
+    events = []
+    params, ll, se, _ = fit_model(t, 100.0, 'go', progress=lambda stage, **info: events.append(info))
+    assert params is not None and np.isfinite(ll)
+    assert {e['engine'] for e in events} == {'multistart'}
+
+def test_crow_amsaa_closed_form_mle():
+    rng = np.random.default_rng(3)
+    lam, beta, T = 2.0, 0.6, 1000.0
+    t = np.sort(T * rng.uniform(size=rng.poisson(lam * T ** beta)) ** (1 / beta))
+    t = np.concatenate(([0.0], t))  # a failure at the time origin is not modelled
+    params, ll, se, total = fit_model(t, T, 'ca')
+    assert total is None
+    assert np.isclose(params[1], (len(t) - 1) / np.sum(np.log(T / t[1:])))
+    assert np.isclose(ca_mu(T, params), len(t) - 1)
+    # No nearby point has a higher likelihood
+    for d in ([1.01, 1], [0.99, 1], [1, 1.001], [1, 0.999]):
+        assert ca_loglik(params * d, t, T) < ll
+
+def test_crow_bounds_bracket_estimates():
+    params = np.array([2.0, 0.6])
+    bounds = crow_bounds(params, 130, 1000.0)
+    assert bounds['beta'][0] < 0.6 < bounds['beta'][1]
+    assert bounds['intensity'][0] < bounds['current_intensity'] < bounds['intensity'][1]
+    assert np.isclose(bounds['current_mtbf'] * bounds['current_intensity'], 1)
+
+def test_crow_bounds_failure_truncated_coverage():
+    # Observation ends at the n-th failure, as in the CLI and API
+    rng = np.random.default_rng(4)
+    lam, beta, n, runs = 2.0, 0.6, 5, 2000
+    hits = np.zeros(2)
+    for _ in range(runs):
+        t = (np.cumsum(rng.exponential(1.0, n)) / lam) ** (1 / beta)
+        params, _ = ca_mle(t, t[-1])
+        bounds = crow_bounds(params, n, t[-1], failure_truncated=True)
+        true_mtbf = 1 / (lam * beta * t[-1] ** (beta - 1))
+        hits += [bounds['beta'][0] <= beta <= bounds['beta'][1],
+                 bounds['mtbf'][0] <= true_mtbf <= bounds['mtbf'][1]]
+    assert np.all(np.abs(hits / runs - 0.95) < 0.015)
+
+def test_crow_screening_compares_models_on_the_same_failures():
+    t = np.concatenate(([0.0], _go_sample(300, 0.02, 100.0, 5)))
+    fits = {m: fit_model(t, t[-1], m) for m in ['go', 'mo']}
+    crow = crow_screening(t, t[-1], compare={m: fit[0] for m, fit in fits.items()})
+    assert crow['failure_truncated'] and crow['n'] == len(t) - 1
+    assert set(crow['aic_comparison']) == {'ca', 'go', 'mo'}
+    # Scored without the failure at the origin that Crow-AMSAA leaves out: as good as a refit
+    refit = fit_model(t[1:], t[-1], 'go')
+    assert abs(crow['aic_comparison']['go'] - (4 - 2 * refit[1])) < 0.05
+    assert crow['aic_comparison']['go'] > 4 - 2 * fits['go'][1]
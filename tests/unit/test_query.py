@@ -0,0 +1,31 @@
+
+import numpy as np
+import pandas as pd
+from modeler.models import go_mu, go_intensity, mo_mu, mo_intensity, ca_intensity
+from modeler.query import fit_record, answer_queries
+
+def _record():
+    fits = {'go': (np.array([500.0, 0.01]), -10.0, None, 500.0),
+            'mo': (np.array([5.0, 0.01]), -11.0, None, 2000.0),
+            'ca': (np.array([5.0, 1.2]), -12.0, None, None)}
+    return fit_record(fits, pd.Timestamp("2025-01-01", tz="UTC"), 100.0, 300, {"Database": 200, "Network": 100})
+
+def test_queries_invert_the_fitted_curves():
+    answers = answer_queries(_record(), hours=[50, 150], dates=["2025-01-03T00:00:00Z"],
+                             intensity_below=[2.0, 1.0], reach=[400, 600])
+    go, mo = answers['go'], answers['mo']
+    assert np.allclose(go['expected_failures']['hours'], [50, 150, 48])
+    assert np.allclose(go['expected_failures']['mean'], go_mu(np.array([50, 150, 48]), [500.0, 0.01]), atol=1e-5)
+    assert np.allclose(go_intensity(np.array(go['intensity_below']['hours']), [500.0, 0.01]), [2.0, 1.0])
+    assert np.allclose(mo_intensity(np.array(mo['intensity_below']['hours']), [5.0, 0.01]), [2.0, 1.0])
+    assert np.allclose(mo_mu(np.array(mo['reach']['hours']), [5.0, 0.01]), [400, 600])
+    assert go['intensity_below']['date'][0].startswith("2025-01-")
+    assert go['reach']['hours'][1] is None and go['reach']['date'][1] is None  # GO never exceeds a = 500
+    assert answers['ca']['intensity_below']['hours'] == [None, None]  # increasing power law never drops
+
+def test_remaining_failures_by_category():
+    answers = answer_queries(_record(), categories=True, models=['go', 'ca'])
+    assert set(answers) == {'go', 'ca'}
+    assert answers['go']['remaining_by_category'] == {"Database": 133.33, "Network": 66.67}
+    assert 'remaining_by_category' not in answers['ca']
+    assert np.isclose(answers['ca']['current_intensity'], ca_intensity(100.0, [5.0, 1.2]))
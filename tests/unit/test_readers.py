@@ -0,0 +1,55 @@
+
+import bz2
+import gzip
+import json
+import lzma
+import pytest
+from modeler.data import read_log_events
+from modeler.readers import detect_format
+
+CSV = ("Date Time Of Error,Error or Fault Description\n"
+       "2025-01-01 00:00:00,disk full\n2025-01-01 02:00:00,timeout\n2025-01-01 01:00:00,crash\n")
+
+@pytest.mark.parametrize("suffix, opener", [(".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)])
+def test_compressed_csv_matches_plain(tmp_path, suffix, opener):
+    plain = tmp_path / "log.csv"
+    plain.write_text(CSV)
+    packed = tmp_path / ("log.csv" + suffix)
+    with opener(packed, "wt") as f:
+        f.write(CSV)
+
+    expected = read_log_events(plain)
+    epoch_ns, descs, rows = read_log_events(packed, chunksize=2)
+    assert list(epoch_ns) == list(expected[0])
+    assert list(descs) == ["disk full", "timeout", "crash"]
+    assert list(rows) == [0, 1, 2]
+
+def test_jsonl_nested_fields_and_prefixes(tmp_path):
+    path = tmp_path / "app.log"
+    lines = ["api-1  | " + json.dumps({"ts": "2025-01-01T00:00:00Z", "error": {"message": "disk full"}}),
+             "api-1  | INFO: started",
+             json.dumps({"ts": 1735693200, "error": {"message": "timeout"}})]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-16")
+
+    assert detect_format(path) == "jsonl"
+    epoch_ns, descs, _ = read_log_events(path, time_field="ts", desc_field="error.message")
+    assert list(descs) == ["disk full", "timeout"]
+    assert (epoch_ns[1] - epoch_ns[0]) // 3_600_000_000_000 == 1
+
+def test_explicit_csv_field_must_exist(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text(CSV)
+    with pytest.raises(ValueError, match="Date Time Of Eror"):
+        read_log_events(path, time_field="Date Time Of Eror")
+    with pytest.raises(ValueError, match="Description"):
+        read_log_events(path, desc_field="Description")
+
+def test_jsonl_fields_are_detected(tmp_path):
+    path = tmp_path / "app.jsonl"
+    lines = [json.dumps({"timestamp": "2025-01-01T00:00:00Z", "level": "error", "msg": "disk full"}),
+             json.dumps({"timestamp": "2025-01-01T01:00:00Z", "level": "error", "msg": "timeout"})]
+    path.write_text("\n".join(lines) + "\n")
+
+    epoch_ns, descs, _ = read_log_events(path)
+    assert list(descs) == ["disk full", "timeout"]
+    assert len(epoch_ns) == 2
@@ -0,0 +1,30 @@
+
+import numpy as np
+from modeler.events import EventTable
+from modeler.series import lttb, step_series, chart_series
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10_000, dtype=float)
+    y = np.zeros_like(x)
+    y[4321] = 50.0
+    kept = lttb(x, y, 100)
+    assert len(kept) == 100
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert 4321 in kept
+    assert list(lttb(x[:50], y[:50], 100)) == list(range(50))
+
+def test_chart_series_is_decimated_per_category():
+    hours = np.sort(np.random.default_rng(0).uniform(0, 100, 5000))
+    descs = np.where(np.arange(5000) % 2, "SQL timeout", "disk full")
+    events = EventTable.build(hours.astype(np.int64), hours, descs,
+                              [("Database", ["sql"]), ("Storage", ["disk"])], False)
+    tt = np.linspace(0, 120, 20)
+    series = chart_series(hours, tt, {"go": tt}, {"go": np.ones_like(tt)}, events, max_points=200)
+
+    assert series["observed"]["points"] == 5000
+    assert len(series["observed"]["time_hours"]) == 200
+    assert series["observed"]["cumulative"][-1] == 5000
+    assert {c["name"]: c["count"] for c in series["categories"]} == {"Database": 2500, "Storage": 2500}
+    assert len(series["models"]["go"]["mu"]) == 20
+    assert step_series([])["points"] == 0
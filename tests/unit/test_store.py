@@ -0,0 +1,71 @@
+
+import numpy as np
+import pytest
+from modeler.data import read_log_events
+from modeler.store import EventStore, load_store_data
+
+CSV = """Date Time Of Error,Error or Fault Description
+2025-01-01 00:00:00,SQL timeout
+2025-01-01 02:00:00,Button not clickable
+2025-01-02 00:00:00,SQL deadlock
+2025-01-03 00:00:00,css broken
+"""
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "cats.conf"
+    path.write_text("Database [sql]\nUI [button, css]\n")
+    return path
+
+def test_ingest_is_idempotent_and_append_only(tmp_path):
+    log = tmp_path / "log.csv"
+    log.write_text(CSV)
+    with EventStore(tmp_path / "events.sqlite") as store:
+        cats = [("Database", {"sql"}), ("UI", {"button", "css"})]
+        assert store.ingest(log, cats) == 4
+        assert store.ingest(log, cats) == 0
+        log.write_text(CSV + "2025-01-04 00:00:00,SQL again\n")
+        assert store.ingest(log, cats) == 1
+        assert store.sources()[0][:2] == ("log.csv", 5)
+
+def test_load_store_data_filters_by_time_and_category(tmp_path, config):
+    log = tmp_path / "log.csv"
+    log.write_text(CSV)
+    store_path = tmp_path / "events.sqlite"
+    with EventStore(store_path) as store:
+        store.ingest(log, [("Database", {"sql"}), ("UI", {"button", "css"})])
+
+    t, events, t0, _ = load_store_data(store_path, config, since="2025-01-01 01:00", until="2025-01-03")
+    assert [row[3] for row in events] == ["Button not clickable", "SQL deadlock"]
+    assert np.allclose(t, [0.0, 22.0])
+
+    t, events, _, _ = load_store_data(store_path, config, categories=["Database"])
+    assert [row[2] for row in events] == ["Database", "Database"]
+
+def test_next_drop_under_the_same_name_is_ingested(tmp_path):
+    cats = [("Database", {"sql"})]
+    log = tmp_path / "error_log.csv"
+    with EventStore(tmp_path / "events.sqlite") as store:
+        log.write_text(CSV.split("2025-01-02")[0])
+        assert store.ingest(log, cats) == 2
+        # The next night's log reuses the file name and starts again at row 0
+        log.write_text("Date Time Of Error,Error or Fault Description\n"
+                       "2025-01-05 00:00:00,SQL timeout\n"
+                       "2025-01-05 00:00:00,SQL timeout\n"
+                       "2025-01-06 00:00:00,css broken\n")
+        assert store.ingest(log, cats) == 3
+        assert store.ingest(log, cats) == 0
+        assert store.sources()[0][:2] == ("error_log.csv", 5)
+
+def test_followed_lines_match_a_full_ingest(tmp_path):
+    cats = [("Database", {"sql"})]
+    rows = ["2025-01-01 00:00:00,SQL timeout", "2025-01-01 00:00:00,SQL timeout", "2025-01-02 00:00:00,css broken"]
+    log = tmp_path / "log.csv"
+    log.write_text("Date Time Of Error,Error or Fault Description\n" + "\n".join(rows) + "\n")
+    epoch_ns, descs, _ = read_log_events(log)
+    with EventStore(tmp_path / "events.sqlite") as store:
+        # Followed in two polls that split the repeated event
+        assert store.ingest_events("log.csv", epoch_ns[:1], descs[:1], cats) == 1
+        assert store.ingest_events("log.csv", epoch_ns[1:], descs[1:], cats, continued=True) == 2
+        assert store.ingest(log, cats) == 0
+        assert store.sources()[0][:2] == ("log.csv", 3)
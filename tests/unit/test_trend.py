@@ -0,0 +1,37 @@
+
+import numpy as np
+from modeler.models import ca_mle
+from modeler.trend import trend_tests, trend_summary_lines
+
+def test_trend_tests_detect_growth():
+    rng = np.random.default_rng(0)
+    b, T = 0.05, 100.0
+    t = np.sort(-np.log1p(-rng.uniform(0, -np.expm1(-b * T), 300)) / b)
+    trend = trend_tests(t, T)
+    assert trend['growth']
+    assert trend['laplace']['statistic'] < 0
+    assert trend['laplace']['p_value'] < 1e-6 and trend['mil_hdbk_189']['p_value'] < 1e-6
+    # The MIL-HDBK-189 statistic is 2n / beta of the Crow-AMSAA fit
+    params, _ = ca_mle(t, T)
+    assert np.isclose(trend['mil_hdbk_189']['statistic'], 2 * trend['n'] / params[1])
+
+def test_trend_tests_without_growth():
+    t = np.sort(np.random.default_rng(1).uniform(0, 100, 300))
+    trend = trend_tests(np.concatenate(([0.0], t)), 100.0)
+    assert trend['n'] == 300
+    assert not trend['growth']
+    assert any("skipped" in line for line in trend_summary_lines(trend, gate='skip'))
+    assert trend_tests(np.array([0.0, 1.0]), 2.0) is None
+
+def test_trend_tests_failure_truncated_size():
+    # The CLI and API observe up to the last failure: trend_tests(t, t[-1])
+    rng = np.random.default_rng(2)
+    runs, laplace, mil = 2000, 0, 0
+    for _ in range(runs):
+        t = np.cumsum(rng.exponential(1.0, 10))
+        trend = trend_tests(t, t[-1])
+        laplace += trend['laplace']['p_value'] < 0.05
+        mil += trend['mil_hdbk_189']['p_value'] < 0.05
+    assert trend['failure_truncated'] and trend['mil_hdbk_189']['df'] == 18
+    # A homogeneous Poisson process must be rejected at the nominal rate
+    assert 0.03 < laplace / runs < 0.07 and 0.03 < mil / runs < 0.07
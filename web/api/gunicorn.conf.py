@@ -0,0 +1,45 @@
+"""Production serving: pre-forked uvicorn workers under gunicorn.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+The app and its heavy imports are loaded once in the master (``preload_app``)
+and then forked, so the workers share those pages copy-on-write. Each worker
+is replaced after ``max_requests`` requests (plus jitter, so they do not all
+restart together) to bound memory growth from matplotlib and pandas.
+
+Progress events of /analyze/stream jobs are also appended to output/jobs/, so
+GET /analyses/{id}/events works whichever worker the request reaches. A
+stopping or recycled worker waits up to main.JOB_SHUTDOWN_SECONDS for its
+running jobs and then reports the rest as failed, within ``graceful_timeout``.
+
+Environment:
+    WEB_CONCURRENCY       number of workers (default: CPU count)
+    MAX_REQUESTS          requests per worker before it is recycled (default 500, 0 = never)
+    MAX_REQUESTS_JITTER   random extra requests per worker (default 10% of MAX_REQUESTS)
+    PORT                  listening port (default 8000)
+    TIMEOUT               seconds a worker may be silent before it is killed (default 300)
+    GRACEFUL_TIMEOUT      seconds a stopping worker gets before it is killed (default 150)
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+max_requests = int(os.environ.get("MAX_REQUESTS", "500"))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", max_requests // 10))
+# Large logs can keep a worker busy fitting for a while
+timeout = int(os.environ.get("TIMEOUT", "300"))
+# Room for main.JOB_SHUTDOWN_SECONDS of waiting on running analyses
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "150"))
+accesslog = "-"
+
+
+def when_ready(server):
+    # Runs in the master after the app is loaded and before the first fork
+    import main
+    main.preload()
+    # Keep the collector from touching (and so copying) the inherited objects
+    gc.freeze()
+    server.log.info(f"Preloaded; forking {workers} workers, recycled every {max_requests} requests")
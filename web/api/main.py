@@ -1,14 +1,20 @@
 import os
 import sys
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import re
+import asyncio
+import hashlib
+import functools
+import itertools
+import time
+import contextlib
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import io
 from pathlib import Path
 from datetime import datetime
@@ -20,14 +26,32 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append("/app")
 
 from modeler.data import load_failure_data, categorize_description, load_fault_categories
-from modeler.models import fit_model, go_mu, mo_mu, go_intensity, mo_intensity
-from modeler.plots import plot_reliability_growth, plot_failure_intensity, plot_categories
+from modeler.models import (fit_model, crow_bounds, aic_after_origin, MEAN_FUNCTIONS, INTENSITY_FUNCTIONS,
+                            MODEL_NAMES)
+from modeler.forecast import simulate_future_failures
+from modeler.store import EventStore, load_store_data
+from modeler.series import chart_series, MAX_POINTS
+from modeler.intensity import kernel_intensity
+from modeler.trend import trend_tests
+from modeler.query import fit_record, answer_queries
 
 # Define base directory for relative path resolution
 BASE_DIR = Path(__file__).resolve().parent
 ROOT_DIR = BASE_DIR.parent.parent
+EVENT_STORE_PATH = ROOT_DIR / "output" / "events.sqlite"
+# Fitted parameters of archived analyses, by analysis id, for /analyses/{id}/query
+FITS_DIR = ROOT_DIR / "output" / "fits"
+# One empty file per analysis id handed out, so pre-forked workers never reuse one
+ANALYSIS_IDS_DIR = ROOT_DIR / "output" / "ids"
+# Ids are timestamped to the second, so a claim only has to outlive its second
+ANALYSIS_ID_CLAIM_SECONDS = 60.0
 
-app = FastAPI(title="Reliability Modeler API")
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    yield
+    await finish_running_jobs()
+
+app = FastAPI(title="Reliability Modeler API", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -37,6 +61,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compresses JSON responses; event streams are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Progress streams of analyses started through /analyze/stream, by analysis id
+ANALYSIS_JOBS = {}
+MAX_FINISHED_JOBS = 50
+SSE_KEEPALIVE_SECONDS = 15.0
+# Every job's events are also appended here, so any pre-forked worker can stream them
+JOBS_DIR = ROOT_DIR / "output" / "jobs"
+JOB_POLL_SECONDS = 0.25
+# A job log that stops growing this long belongs to a worker that died mid-analysis
+JOB_STALE_SECONDS = 300.0
+# A stopping or recycled worker waits this long for its running jobs before failing them
+JOB_SHUTDOWN_SECONDS = 120.0
+
+# Numbers temporary upload and plot files (next() on a count is atomic)
+SCRATCH_IDS = itertools.count()
 
 class Settings(BaseModel):
     multi_label: bool = False
@@ -51,6 +92,83 @@ def load_persistent_settings() -> Settings:
             return Settings(**json.load(f))
     return Settings()
 
+def get_config_path() -> Path:
+    config_path = ROOT_DIR / "fault_categories.conf"
+    if not config_path.exists():
+        config_path = Path("/app/fault_categories.conf")
+    return config_path
+
+def preload():
+    """Import and warm up everything requests need, once, before workers are forked.
+
+    Called by the pre-fork server (``gunicorn.conf.py``) in its master process so
+    matplotlib, its font cache and the parsed taxonomy are shared copy-on-write
+    by all workers instead of being rebuilt by each on its first request.
+    """
+    import matplotlib.pyplot as plt
+    from modeler import plots  # noqa: F401
+
+    fig = plt.figure(figsize=(2, 2))
+    plt.plot([0, 1], [0, 1], label="warm-up")
+    plt.legend()
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+    load_fault_categories(get_config_path())
+
+def analysis_window(since, until, category, source, has_file):
+    """Time range and filters for an analysis; source/category need the event store."""
+    if has_file and (category or source):
+        raise HTTPException(status_code=400, detail="category and source filters apply to the event store only")
+    if not has_file and not EVENT_STORE_PATH.exists():
+        raise HTTPException(status_code=404, detail="No file uploaded and the event store is empty")
+    window = {"since": since, "until": until}
+    if not has_file:
+        window.update(categories=category, sources=source)
+    return window
+
+def forecast_options(
+    forecast_hours: Optional[List[float]] = Query(None),
+    forecast_exceed: List[int] = Query([0]),
+    forecast_paths: int = Query(20000, ge=100, le=200000),
+):
+    """Monte Carlo forecast request; the forecast is only computed when horizons are given."""
+    if not forecast_hours:
+        return None
+    return {"horizons": forecast_hours, "exceed": forecast_exceed, "n_paths": forecast_paths}
+
+def render_options(
+    render: Literal["png", "data"] = "png",
+    max_points: int = Query(MAX_POINTS, ge=3, le=100000),
+):
+    """``png`` renders the charts server-side; ``data`` returns their series instead."""
+    return {"render": render, "max_points": max_points}
+
+def analysis_etag(upload: Optional[bytes], **options):
+    """Validator for an analysis result: the input data, the options, the taxonomy and the settings.
+
+    It is weak: each run gets a new id and a fresh Monte Carlo forecast, so
+    equal inputs give equivalent, not byte-identical, responses.
+    """
+    h = hashlib.sha1()
+    if upload is not None:
+        h.update(upload)
+    else:
+        st = EVENT_STORE_PATH.stat()
+        h.update(f"store:{st.st_size}:{st.st_mtime_ns}".encode())
+    h.update(json.dumps(options, sort_keys=True, default=str).encode())
+    config_path = get_config_path()
+    if config_path.exists():
+        h.update(config_path.read_bytes())
+    h.update(load_persistent_settings().model_dump_json().encode())
+    return f'W/"{h.hexdigest()}"'
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Weak comparison of ``If-None-Match``: opaque tags match whether or not either is marked ``W/``."""
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in tags
+
 def save_to_archive(log_id, filename, summary):
     log_dir = ROOT_DIR / "output" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -64,6 +182,177 @@ def save_to_archive(log_id, filename, summary):
     with open(log_dir / f"{log_id}.json", "w") as f:
         json.dump(entry, f)
 
+def save_fit_record(log_id, record):
+    FITS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(FITS_DIR / f"{log_id}.json", "w") as f:
+        json.dump(record, f)
+
+@functools.lru_cache(maxsize=256)
+def load_fit_record(log_id):
+    """Fit record of an archived analysis; records never change once written, so they are cached."""
+    path = FITS_DIR / f"{log_id}.json"
+    if not re.fullmatch(r"[\w-]+", log_id) or not path.exists():
+        raise HTTPException(status_code=404, detail="No fitted parameters stored for this analysis")
+    with open(path) as f:
+        return json.load(f)
+
+def new_analysis_id():
+    """Timestamped id, claimed by creating its file exclusively so it is unique across processes."""
+    ANALYSIS_IDS_DIR.mkdir(parents=True, exist_ok=True)
+    prune_analysis_ids()
+    log_id = f"AN-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    candidate, suffix = log_id, 1
+    while True:
+        try:
+            (ANALYSIS_IDS_DIR / candidate).touch(exist_ok=False)
+            return candidate
+        except FileExistsError:
+            suffix += 1
+            candidate = f"{log_id}-{suffix}"
+
+def prune_analysis_ids():
+    """Drop id claims whose second has long passed; no process can hand out those ids again."""
+    cutoff = time.time() - ANALYSIS_ID_CLAIM_SECONDS
+    for path in ANALYSIS_IDS_DIR.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            # Another worker pruned it first
+            pass
+
+def scratch_name(name):
+    """``name`` made unique per process and call, for temporary files other requests may also be writing."""
+    return f"{os.getpid()}_{next(SCRATCH_IDS)}_{name}"
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def format_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n"
+
+class AnalysisJob:
+    """Progress events of one analysis, replayed to every SSE subscriber.
+
+    ``publish`` may be called from the worker thread running the pipeline; the
+    event is handed over to the event loop, which owns all job state. Events
+    are also appended to ``JOBS_DIR/<id>.jsonl`` for subscribers connected to
+    other worker processes (see ``tail_job_log``).
+    """
+    TERMINAL_EVENTS = ("result", "error")
+
+    def __init__(self, job_id: str, loop: asyncio.AbstractEventLoop):
+        self.id = job_id
+        self.loop = loop
+        self.events = []
+        self.done = False
+        self.finished = asyncio.Event()
+        self._subscribers = []
+        # Created up front so other workers find the job as soon as its id is returned
+        JOBS_DIR.mkdir(parents=True, exist_ok=True)
+        self.log_path = JOBS_DIR / f"{job_id}.jsonl"
+        self.log_path.touch()
+
+    def publish(self, event: str, **data):
+        self.loop.call_soon_threadsafe(self._publish, event, data)
+
+    def _publish(self, event, data):
+        # A job failed at shutdown may still complete afterwards; its stream has ended
+        if self.done:
+            return
+        self.events.append((event, data))
+        if event in self.TERMINAL_EVENTS:
+            self.done = True
+            self.finished.set()
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"event": event, "data": data}, default=_json_default) + "\n")
+        for queue in self._subscribers:
+            queue.put_nowait((event, data))
+
+    async def stream(self):
+        queue = asyncio.Queue()
+        history = list(self.events)
+        self._subscribers.append(queue)
+        try:
+            for event, data in history:
+                yield format_sse(event, data)
+            if self.done:
+                return
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event, data)
+                if event in self.TERMINAL_EVENTS:
+                    return
+        finally:
+            self._subscribers.remove(queue)
+
+async def tail_job_log(path: Path):
+    """SSE stream of a job run by another worker, read from its event log as it grows."""
+    offset, pending = 0, b""
+    idle_since = last_sent = asyncio.get_running_loop().time()
+    while True:
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            yield format_sse("error", {"detail": "Analysis log was removed"})
+            return
+        offset += len(chunk)
+        # Only complete lines; the writer may be half-way through one
+        *lines, pending = (pending + chunk).split(b"\n")
+        now = asyncio.get_running_loop().time()
+        for line in lines:
+            record = json.loads(line)
+            yield format_sse(record["event"], record["data"])
+            if record["event"] in AnalysisJob.TERMINAL_EVENTS:
+                return
+        if chunk:
+            idle_since = last_sent = now
+        elif now - idle_since > JOB_STALE_SECONDS:
+            yield format_sse("error", {"detail": "Analysis stopped reporting progress"})
+            return
+        elif now - last_sent >= SSE_KEEPALIVE_SECONDS:
+            last_sent = now
+            yield ": keep-alive\n\n"
+        await asyncio.sleep(JOB_POLL_SECONDS)
+
+async def finish_running_jobs():
+    """Let running jobs finish when the worker stops, failing those still running after ``JOB_SHUTDOWN_SECONDS``.
+
+    Gunicorn recycles a worker after ``max_requests`` requests although
+    /analyze/stream jobs may still be running in its thread pool. Without a
+    terminal event their subscribers would wait ``JOB_STALE_SECONDS``.
+    """
+    running = [job for job in ANALYSIS_JOBS.values() if not job.done]
+    if not running:
+        return
+    try:
+        await asyncio.wait_for(asyncio.gather(*(job.finished.wait() for job in running)), JOB_SHUTDOWN_SECONDS)
+    except asyncio.TimeoutError:
+        for job in running:
+            job._publish("error", {"detail": "The server stopped before the analysis finished; please retry"})
+
+def prune_finished_jobs():
+    finished = [job_id for job_id, job in ANALYSIS_JOBS.items() if job.done]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del ANALYSIS_JOBS[job_id]
+    # Event logs are shared by all workers; keep the most recent ones
+    if JOBS_DIR.exists():
+        logs = sorted(JOBS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+        for path in logs[:max(0, len(logs) - MAX_FINISHED_JOBS)]:
+            path.unlink(missing_ok=True)
+
 @app.get("/logs")
 async def get_logs():
     log_dir = ROOT_DIR / "output" / "logs"
@@ -77,6 +366,31 @@ async def get_logs():
     
     return sorted(logs, key=lambda x: x['date'], reverse=True)
 
+@app.get("/analyses/{analysis_id}/query")
+async def query_analysis(
+    analysis_id: str,
+    hours: List[float] = Query([]),
+    at: List[str] = Query([]),
+    intensity_below: List[float] = Query([]),
+    reach: List[float] = Query([]),
+    categories: bool = False,
+    model: Optional[List[str]] = Query(None),
+):
+    """What-if questions answered from an analysis's stored fit, without re-reading its data.
+
+    ``hours``/``at``: expected failures at those times; ``intensity_below``:
+    when the failure rate falls below each value; ``reach``: when each total
+    failure count is expected; ``categories``: remaining failures per category.
+    Every parameter may be repeated to ask many questions in one call.
+    """
+    record = load_fit_record(analysis_id)
+    try:
+        answers = answer_queries(record, hours, at, intensity_below, reach, categories, model)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"id": analysis_id, "start_time": record["start_time"], "duration_hours": record["duration_hours"],
+            "failures": record["failures"], "models": answers}
+
 @app.get("/config")
 async def get_config():
     # Priority: Local ROOT_DIR config, then Docker-style /app config
@@ -105,19 +419,130 @@ async def save_config(data: dict):
 
 @app.post("/analyze")
 async def analyze_failure_data(
-    file: UploadFile = File(...),
+    request: Request,
+    response: Response,
+    file: Optional[UploadFile] = File(None),
     future_hours: float = 1000.0,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    category: Optional[List[str]] = Query(None),
+    source: Optional[List[str]] = Query(None),
+    forecast: Optional[dict] = Depends(forecast_options),
+    render: dict = Depends(render_options),
+    trend_gate: Literal["off", "flag", "skip"] = "flag",
 ):
+    """Analyze an uploaded CSV, or a time window of the event store when no file is sent.
+
+    Responses carry an ETag; a request with a matching ``If-None-Match`` gets
+    ``304 Not Modified`` without re-running the analysis.
+    """
+    window = analysis_window(since, until, category, source, file is not None)
+    upload = await file.read() if file is not None else None
+    etag = analysis_etag(upload, future_hours=future_hours, window=window, forecast=forecast,
+                         trend_gate=trend_gate, **render)
+    if etag_matches(etag, request.headers.get("if-none-match", "")):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    if file is None:
+        return await run_analysis_pipeline(None, EVENT_STORE_PATH.name, future_hours, window, forecast, render,
+                                           trend_gate)
+
     temp_uploads = ROOT_DIR / "temp_uploads"
     temp_uploads.mkdir(exist_ok=True)
-    csv_path = temp_uploads / file.filename
+    csv_path = temp_uploads / scratch_name(file.filename)
     with open(csv_path, "wb") as f:
-        f.write(await file.read())
+        f.write(upload)
     
-    return await run_analysis_pipeline(csv_path, file.filename, future_hours)
+    return await run_analysis_pipeline(csv_path, file.filename, future_hours, window, forecast, render,
+                                       trend_gate)
+
+@app.post("/analyze/stream")
+async def analyze_failure_data_stream(
+    file: Optional[UploadFile] = File(None),
+    future_hours: float = 1000.0,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    category: Optional[List[str]] = Query(None),
+    source: Optional[List[str]] = Query(None),
+    forecast: Optional[dict] = Depends(forecast_options),
+    render: dict = Depends(render_options),
+    trend_gate: Literal["off", "flag", "skip"] = "flag",
+):
+    """Start an analysis in the background and return its progress stream URL."""
+    window = analysis_window(since, until, category, source, file is not None)
+    prune_finished_jobs()
+    log_id = new_analysis_id()
+    loop = asyncio.get_running_loop()
+    job = AnalysisJob(log_id, loop)
+    ANALYSIS_JOBS[log_id] = job
+
+    csv_path, filename = None, EVENT_STORE_PATH.name
+    if file is not None:
+        temp_uploads = ROOT_DIR / "temp_uploads"
+        temp_uploads.mkdir(exist_ok=True)
+        csv_path, filename = temp_uploads / f"{log_id}_{file.filename}", file.filename
+        with open(csv_path, "wb") as f:
+            f.write(await file.read())
+        job.publish("upload", filename=file.filename, bytes=csv_path.stat().st_size)
+
+    def run():
+        try:
+            result = analysis_pipeline(csv_path, filename, future_hours, window, forecast, render,
+                                       trend_gate, job=job, log_id=log_id)
+            job.publish("result", **result)
+        except HTTPException as e:
+            job.publish("error", detail=e.detail)
+        except Exception as e:
+            job.publish("error", detail=str(e))
+
+    loop.run_in_executor(None, run)
+    return {"id": log_id, "events": f"/analyses/{log_id}/events"}
+
+@app.get("/analyses/{analysis_id}/events")
+async def analysis_events(analysis_id: str):
+    """Server-Sent Events stream of an analysis started via /analyze/stream, on any worker."""
+    job = ANALYSIS_JOBS.get(analysis_id)
+    if job is not None:
+        stream = job.stream()
+    else:
+        path = JOBS_DIR / f"{analysis_id}.jsonl"
+        if not re.fullmatch(r"[\w-]+", analysis_id) or not path.exists():
+            raise HTTPException(status_code=404, detail="Analysis not found")
+        stream = tail_job_log(path)
+    return StreamingResponse(stream, media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.post("/store/ingest")
+async def ingest_into_store(file: UploadFile = File(...), source: Optional[str] = None):
+    """Append the new rows of an uploaded log to the event store (idempotent per source row)."""
+    temp_uploads = ROOT_DIR / "temp_uploads"
+    temp_uploads.mkdir(exist_ok=True)
+    csv_path = temp_uploads / scratch_name(f"ingest_{file.filename}")
+    with open(csv_path, "wb") as f:
+        f.write(await file.read())
+    try:
+        with EventStore(EVENT_STORE_PATH) as store:
+            added = store.ingest(csv_path, load_fault_categories(get_config_path()),
+                                 source=source or file.filename)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        csv_path.unlink(missing_ok=True)
+    return {"source": source or file.filename, "added": added}
+
+@app.get("/store/sources")
+async def store_sources():
+    if not EVENT_STORE_PATH.exists():
+        return []
+    with EventStore(EVENT_STORE_PATH) as store:
+        rows = store.sources()
+    return [{"source": src, "events": count,
+             "first": pd.Timestamp(first, tz="UTC").isoformat(),
+             "last": pd.Timestamp(last, tz="UTC").isoformat()} for src, count, first, last in rows]
 
 @app.get("/sample-data")
-async def analyze_sample_data():
+async def analyze_sample_data(render: dict = Depends(render_options)):
     sample_path = BASE_DIR / "sample_data.csv"
     if not sample_path.exists():
         sample_path = Path("/app/sample_data.csv")
@@ -125,19 +550,46 @@ async def analyze_sample_data():
     if not sample_path.exists():
         raise HTTPException(status_code=404, detail="Sample data not found")
         
-    return await run_analysis_pipeline(sample_path, "sample_data.csv", 1000.0)
+    return await run_analysis_pipeline(sample_path, "sample_data.csv", 1000.0, render=render)
+
+async def run_analysis_pipeline(csv_path: Optional[Path], filename: str, future_hours: float,
+                                window: Optional[dict] = None, forecast: Optional[dict] = None,
+                                render: Optional[dict] = None, trend_gate: str = "flag"):
+    # Off the event loop, so open progress streams keep flowing while this analysis runs
+    return await asyncio.get_running_loop().run_in_executor(
+        None, analysis_pipeline, csv_path, filename, future_hours, window, forecast, render, trend_gate)
 
-async def run_analysis_pipeline(csv_path: Path, filename: str, future_hours: float):
+def analysis_pipeline(csv_path: Optional[Path], filename: str, future_hours: float,
+                      window: Optional[dict] = None, forecast: Optional[dict] = None,
+                      render: Optional[dict] = None, trend_gate: str = "flag",
+                      job: Optional[AnalysisJob] = None, log_id: Optional[str] = None):
+    """Run the full analysis; ``job`` receives progress and partial results.
+
+    Without ``csv_path`` the events are read from the event store; ``window``
+    holds the time range (and store-only source/category filters). ``forecast``
+    holds the Monte Carlo forecast options from ``forecast_options``. With
+    ``render={"render": "data"}`` no PNG is drawn (matplotlib is never
+    imported) and the chart series are returned under ``series`` instead.
+    ``trend_gate`` decides what happens to the GO/MO fits when the trend
+    tests find no reliability growth (``off``, ``flag`` or ``skip``).
+    """
+    window = window or {}
+    render = render or {"render": "png", "max_points": MAX_POINTS}
+    publish = job.publish if job else (lambda event, **data: None)
+    progress = job.publish if job else None
     try:
         settings = load_persistent_settings()
-        config_path = ROOT_DIR / "fault_categories.conf"
-        if not config_path.exists():
-            config_path = Path("/app/fault_categories.conf")
+        config_path = get_config_path()
             
         # 1. Load data
-        t, categorized, t0, fault_categories = load_failure_data(
-            csv_path, config_path, multi_label=settings.multi_label
-        )
+        if csv_path is None:
+            t, categorized, t0, fault_categories = load_store_data(
+                EVENT_STORE_PATH, config_path, multi_label=settings.multi_label, progress=progress, **window
+            )
+        else:
+            t, categorized, t0, fault_categories = load_failure_data(
+                csv_path, config_path, multi_label=settings.multi_label, progress=progress, **window
+            )
         
         if len(t) == 0:
             raise Exception("No valid failure data found in CSV")
@@ -151,25 +603,42 @@ async def run_analysis_pipeline(csv_path: Path, filename: str, future_hours: flo
         curves = {}
         curves_intensity = {}
         fit_data = {}
+        fits = {}
+
+        trend = trend_tests(t, T)
+        models = ['go', 'mo', 'ca']
+        if trend:
+            trend["gate"] = trend_gate
+            trend["flagged"] = not trend["growth"] and trend_gate == "flag"
+            trend["skipped_fits"] = not trend["growth"] and trend_gate == "skip"
+            if trend["skipped_fits"]:
+                models = ['ca']
+            publish("trend", **trend)
 
-        for m in ['go', 'mo']:
-            params, ll, se, total_exp = fit_model(t, T, model_name=m, method=settings.optimization_method, tol=settings.tolerance)
-            name = "Goel-Okumoto" if m == 'go' else "Musa-Okumoto"
+        for m in models:
+            params, ll, se, total_exp = fit_model(t, T, model_name=m, method=settings.optimization_method,
+                                                  tol=settings.tolerance, progress=progress)
+            if params is None:
+                continue
+            name = MODEL_NAMES[m]
             
-            mu = go_mu(tt, params) if m == 'go' else mo_mu(tt, params)
-            intensity = go_intensity(tt, params) if m == 'go' else mo_intensity(tt, params)
+            mu = MEAN_FUNCTIONS[m](tt, params)
+            intensity = INTENSITY_FUNCTIONS[m](tt, params)
             
             curves[m] = mu
             curves_intensity[m] = intensity
             
             # For plot_reliability_growth which expects specific results dict
             fit_data[m] = (params, ll, se, name) 
+            fits[m] = (params, ll, se, total_exp)
 
             param_map = {}
             if m == 'go':
                 param_map = {"a": params[0], "b": params[1]}
-            else:
+            elif m == 'mo':
                 param_map = {"lambda0": params[0], "theta": params[1]}
+            else:
+                param_map = {"lambda": params[0], "beta": params[1]}
 
             # AIC = 2k - 2ln(L)
             k = len(params)
@@ -179,32 +648,47 @@ async def run_analysis_pipeline(csv_path: Path, filename: str, future_hours: flo
                 "id": m,
                 "name": name,
                 "aic": round(aic, 4),
+                # Crow-AMSAA leaves out the failure at the origin; this one ranks all models fairly
+                "aic_after_origin": round(aic_after_origin(t, T, m, params), 4),
                 "total_expected_failures": round(float(total_exp), 2) if total_exp is not None else None,
-                "parameters": {k: round(float(v), 6) for k, v in param_map.items()}
+                "parameters": {k: round(float(v), 6) for k, v in param_map.items()},
+                **({"crow_bounds": crow_bounds(params, int(np.sum(t > 0)), T, failure_truncated=True)}
+                   if m == 'ca' else {})
             })
+            publish("model", **results_list[-1])
 
-        # 3. Plots
-        plots_b64 = {}
-        temp_plots = ROOT_DIR / "temp_plots"
-        temp_plots.mkdir(exist_ok=True)
-        prefix = str(temp_plots / f"plot_{datetime.now().strftime('%H%M%S')}")
+        # Fitted parameters are complete before any plot is rendered
+        publish("models", models=results_list)
 
-        rel_plot = plot_reliability_growth(t, n, curves, fit_data, None, tt, prefix)
-        intensity_plot = plot_failure_intensity(tt, curves_intensity, None, prefix)
-        cat_plot = plot_categories(categorized, prefix)
+        forecast_result = None
+        if forecast:
+            # None when no model could be fitted
+            forecast_result = simulate_future_failures(fits, T, t=t, **forecast)
+            if forecast_result is not None:
+                publish("forecast", **forecast_result)
 
-        for name, path in [("reliability", rel_plot), ("intensity", intensity_plot), ("categories", cat_plot)]:
-            if path and os.path.exists(path):
-                with open(path, "rb") as f:
-                    plots_b64[name] = base64.b64encode(f.read()).decode('utf-8')
-                os.remove(path)
+        empirical, bandwidth = kernel_intensity(t, tt, T)
+        empirical_intensity = {
+            "bandwidth_hours": round(float(bandwidth), 6) if bandwidth else None,
+            "time_hours": np.round(tt, 4).tolist(),
+            "intensity": [round(float(v), 6) if np.isfinite(v) else None for v in empirical],
+        }
+
+        # 3. Plots, or the series to draw them client-side
+        charts = {}
+        if render["render"] == "data":
+            charts["series"] = chart_series(t, tt, curves, curves_intensity, categorized, render["max_points"])
+        else:
+            charts["plots"] = render_plots(t, n, curves, curves_intensity, fit_data, tt, categorized, publish,
+                                           empirical)
 
         # 4. Save to archive
-        log_id = f"AN-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        log_id = log_id or new_analysis_id()
         save_to_archive(log_id, filename, {
             "total_failures": n,
             "duration_hours": round(T, 2)
         })
+        save_fit_record(log_id, fit_record(fits, t0, T, n, categorized.category_counts()))
 
         return {
             "id": log_id,
@@ -214,17 +698,47 @@ async def run_analysis_pipeline(csv_path: Path, filename: str, future_hours: flo
                 "start_time": t0.isoformat() if hasattr(t0, 'isoformat') else str(t0)
             },
             "models": results_list,
-            "plots": plots_b64,
+            **({"forecast": forecast_result} if forecast_result else {}),
+            "trend_tests": trend,
+            "empirical_intensity": empirical_intensity,
+            **charts,
             "categorized_failures": categorized[:100]
         }
     except Exception as e:
         print(f"Pipeline error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        if csv_path.name == "temp_upload.csv" or csv_path.parent.name == "temp_uploads":
+        if csv_path is not None and (csv_path.name == "temp_upload.csv" or csv_path.parent.name == "temp_uploads"):
             if csv_path.exists() and "sample_data" not in csv_path.name:
                 csv_path.unlink()
 
+def render_plots(t, n, curves, curves_intensity, fit_data, tt, categorized, publish, empirical=None):
+    """Render the three charts and return them base64-encoded by name."""
+    from modeler.plots import plot_reliability_growth, plot_failure_intensity, plot_categories, PLOT_LOCK
+
+    plots_b64 = {}
+    temp_plots = ROOT_DIR / "temp_plots"
+    temp_plots.mkdir(exist_ok=True)
+    prefix = str(temp_plots / scratch_name(f"plot_{datetime.now().strftime('%H%M%S')}"))
+
+    plot_jobs = [
+        ("reliability", lambda: plot_reliability_growth(t, n, curves, fit_data, None, tt, prefix)),
+        ("intensity", lambda: plot_failure_intensity(tt, curves_intensity, None, prefix, empirical)),
+        ("categories", lambda: plot_categories(categorized, prefix)),
+    ]
+    for name, render in plot_jobs:
+        publish("plot", name=name, status="rendering")
+        with PLOT_LOCK:
+            path = render()
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                plots_b64[name] = base64.b64encode(f.read()).decode('utf-8')
+            os.remove(path)
+            publish("plot", name=name, status="done")
+        else:
+            publish("plot", name=name, status="failed")
+    return plots_b64
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -27,6 +27,7 @@ interface AnalysisResults {
         id: string;
         name: string;
         aic: number;
+        aic_after_origin?: number;
         total_expected_failures: number | null;
         parameters: Record<string, number>;
     }>;
@@ -43,7 +44,9 @@ export default function Dashboard({
     futureHours: number,
     onFutureHoursChange: (h: number) => void
 }) {
-    const bestModel = data.models.reduce((prev, curr) => prev.aic < curr.aic ? prev : curr);
+    // Only AICs scored on the same failures can be compared (Crow-AMSAA leaves out the one at the origin)
+    const rankingAic = (m: AnalysisResults['models'][number]) => m.aic_after_origin ?? m.aic;
+    const bestModel = data.models.reduce((prev, curr) => rankingAic(prev) < rankingAic(curr) ? prev : curr);
 
     return (
         <div className="space-y-8 animate-in fade-in slide-in-from-bottom-4 duration-700">